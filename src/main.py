@@ -180,6 +180,9 @@ class TradingSystem:
         if self.alpaca_client:
             await self.alpaca_client.close()
 
+        if self.journal:
+            self.journal.close()
+
         logger.info("Shutdown complete")
 
 
@@ -16,6 +16,7 @@ from .engine import (
     RiskEngine,
     RiskLimits,
     RiskCheckResult,
+    RiskCheck,
     RiskAction,
     Order,
     Position,
@@ -43,6 +44,8 @@ from .position_sizing import (
     TradeStats,
     PositionSizeResult,
     calculate_kelly_from_trades,
+    calculate_kelly_from_returns,
+    multi_asset_kelly,
     optimal_f_from_trades,
 )
 
@@ -93,6 +96,7 @@ __all__ = [
     "RiskEngine",
     "RiskLimits",
     "RiskCheckResult",
+    "RiskCheck",
     "RiskAction",
     "Order",
     "Position",
@@ -116,6 +120,8 @@ __all__ = [
     "TradeStats",
     "PositionSizeResult",
     "calculate_kelly_from_trades",
+    "calculate_kelly_from_returns",
+    "multi_asset_kelly",
     "optimal_f_from_trades",
     
     # Drawdown Protection
@@ -11,17 +11,23 @@ Implements all required risk controls:
 """
 
 import asyncio
+import fnmatch
 import logging
+import re
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
-from enum import Enum
-from typing import Optional, Dict, List, Set, Callable, Any
+from enum import Enum, IntFlag, auto
+from functools import lru_cache
+from typing import Optional, Dict, Set, Tuple, Callable, Any, Sequence, Pattern
 from collections import deque
 import json
 
 logger = logging.getLogger(__name__)
 
+# Shared read-only sentinel for empty check lists on RiskCheckResult
+_EMPTY: tuple = ()
+
 
 class RiskAction(Enum):
     APPROVE = "approve"
@@ -36,6 +42,64 @@ class CircuitState(Enum):
     HALF_OPEN = "half_open"  # Testing recovery
 
 
+class RiskCheck(IntFlag):
+    """Pre-trade checks, in the order check_order runs them."""
+    SYMBOL_ALLOWLIST = auto()
+    SYMBOL_BLOCKLIST = auto()
+    ORDER_NOTIONAL = auto()
+    ORDER_SHARES = auto()
+    POSITION_SHARES = auto()
+    POSITION_NOTIONAL = auto()
+    TOTAL_EXPOSURE = auto()
+    CONCENTRATION = auto()
+    DAILY_LOSS_LIMIT = auto()
+    WEEKLY_LOSS_LIMIT = auto()
+    DRAWDOWN_LIMIT = auto()
+    DAILY_SPEND_LIMIT = auto()
+    WEEKLY_SPEND_LIMIT = auto()
+    MONTHLY_SPEND_LIMIT = auto()
+
+
+# Plain-int bits for check_order's accumulator: IntFlag.__or__ is Python-level
+# and allocates a new flag per call, so the mask stays an int until decoded
+_SYMBOL_ALLOWLIST = int(RiskCheck.SYMBOL_ALLOWLIST)
+_SYMBOL_BLOCKLIST = int(RiskCheck.SYMBOL_BLOCKLIST)
+_ORDER_NOTIONAL = int(RiskCheck.ORDER_NOTIONAL)
+_ORDER_SHARES = int(RiskCheck.ORDER_SHARES)
+_POSITION_SHARES = int(RiskCheck.POSITION_SHARES)
+_POSITION_NOTIONAL = int(RiskCheck.POSITION_NOTIONAL)
+_TOTAL_EXPOSURE = int(RiskCheck.TOTAL_EXPOSURE)
+_CONCENTRATION = int(RiskCheck.CONCENTRATION)
+_DAILY_LOSS_LIMIT = int(RiskCheck.DAILY_LOSS_LIMIT)
+_WEEKLY_LOSS_LIMIT = int(RiskCheck.WEEKLY_LOSS_LIMIT)
+_DRAWDOWN_LIMIT = int(RiskCheck.DRAWDOWN_LIMIT)
+_DAILY_SPEND_LIMIT = int(RiskCheck.DAILY_SPEND_LIMIT)
+_WEEKLY_SPEND_LIMIT = int(RiskCheck.WEEKLY_SPEND_LIMIT)
+_MONTHLY_SPEND_LIMIT = int(RiskCheck.MONTHLY_SPEND_LIMIT)
+
+
+@lru_cache(maxsize=None)
+def _passed_check_names(mask: int) -> tuple:
+    """Decode a RiskCheck mask into check names (shared tuple per mask)."""
+    return tuple(check.name.lower() for check in RiskCheck if mask & check)
+
+
+def _compile_symbol_patterns(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    """Fold glob patterns into one alternation so a check is a single match."""
+    if not patterns:
+        return None
+    return re.compile("|".join(fnmatch.translate(p) for p in patterns))
+
+
+# List-valued keys of RiskLimits.to_dict(), copied on every call
+_LIMITS_LIST_KEYS = (
+    "allowed_symbols",
+    "blocked_symbols",
+    "blocked_symbol_prefixes",
+    "blocked_symbol_patterns",
+)
+
+
 @dataclass
 class RiskLimits:
     """Configurable risk limits."""
@@ -71,9 +135,63 @@ class RiskLimits:
     # Symbol restrictions
     allowed_symbols: Optional[Set[str]] = None  # If set, whitelist mode
     blocked_symbols: Set[str] = field(default_factory=set)  # Blocklist
+    blocked_symbol_prefixes: Tuple[str, ...] = ()  # Block every symbol starting with one of these
+    
+    # Single regex compiled from blocked_symbol_patterns by __setattr__. Declared
+    # ahead of that field so __init__ sets this default first, then the patterns.
+    _blocked_symbol_regex: Optional[Pattern[str]] = field(default=None, init=False, repr=False, compare=False)
+    blocked_symbol_patterns: Tuple[str, ...] = ()  # Glob patterns, e.g. "*.WS" or "SPX??"
+    
+    # Memoized to_dict() output; cleared on any attribute assignment
+    _dict_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any):
+        if name == "blocked_symbol_prefixes":
+            # str.startswith needs a tuple; accept any iterable from config
+            value = tuple(value)
+        elif name == "blocked_symbol_patterns":
+            value = tuple(value)
+            object.__setattr__(self, "_blocked_symbol_regex", _compile_symbol_patterns(value))
+        object.__setattr__(self, name, value)
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
+    
+    def invalidate_cache(self):
+        """Drop the memoized dict after in-place changes to the symbol sets."""
+        self._dict_cache = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializable view of the limits, rebuilt only after a change."""
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "max_order_notional": str(self.max_order_notional),
+                "max_order_shares": self.max_order_shares,
+                "max_position_notional": str(self.max_position_notional),
+                "max_position_shares": self.max_position_shares,
+                "max_total_exposure": str(self.max_total_exposure),
+                "max_concentration_pct": str(self.max_concentration_pct),
+                "max_daily_loss": str(self.max_daily_loss),
+                "max_weekly_loss": str(self.max_weekly_loss),
+                "max_drawdown_pct": str(self.max_drawdown_pct),
+                "daily_spend_limit": str(self.daily_spend_limit),
+                "weekly_spend_limit": str(self.weekly_spend_limit),
+                "monthly_spend_limit": str(self.monthly_spend_limit),
+                "approval_notional_threshold": str(self.approval_notional_threshold),
+                "approval_loss_threshold": str(self.approval_loss_threshold),
+                "allowed_symbols": list(self.allowed_symbols) if self.allowed_symbols else None,
+                "blocked_symbols": list(self.blocked_symbols),
+                "blocked_symbol_prefixes": list(self.blocked_symbol_prefixes),
+                "blocked_symbol_patterns": list(self.blocked_symbol_patterns),
+            }
+        # Fresh lists per call so a caller's edits can't leak into the cache
+        result = dict(self._dict_cache)
+        for key in _LIMITS_LIST_KEYS:
+            if result[key] is not None:
+                result[key] = list(result[key])
+        return result
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """Order representation for risk checks."""
     symbol: str
@@ -92,7 +210,7 @@ class Order:
         return price * self.qty
 
 
-@dataclass 
+@dataclass(slots=True)
 class Position:
     """Position representation."""
     symbol: str
@@ -103,13 +221,18 @@ class Position:
     unrealized_pnl: Decimal
 
 
-@dataclass
+@dataclass(slots=True)
 class RiskCheckResult:
-    """Result of a risk check."""
+    """
+    Result of a risk check.
+    
+    Empty check lists default to a shared empty tuple, so treat them as
+    read-only.
+    """
     action: RiskAction
-    checks_passed: List[str]
-    checks_failed: List[str]
-    warnings: List[str]
+    checks_passed: Sequence[str] = _EMPTY
+    checks_failed: Sequence[str] = _EMPTY
+    warnings: Sequence[str] = _EMPTY
     approval_reason: Optional[str] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
     
@@ -182,7 +305,6 @@ class CircuitBreaker:
         self.recent_orders.append({
             "success": success,
             "slippage": slippage_pct,
-            "time": datetime.now()
         })
         
         # Check if we should trip
@@ -197,17 +319,17 @@ class CircuitBreaker:
     
     def _trip(self, reason: str):
         """Trip the circuit breaker."""
-        if self.state == CircuitState.CLOSED:
+        if self.state is CircuitState.CLOSED:
             logger.warning(f"Circuit breaker TRIPPED: {reason}")
             self.state = CircuitState.OPEN
             self.opened_at = datetime.now()
     
     def can_trade(self) -> tuple[bool, Optional[str]]:
         """Check if trading is allowed."""
-        if self.state == CircuitState.CLOSED:
+        if self.state is CircuitState.CLOSED:
             return True, None
         
-        if self.state == CircuitState.OPEN and self.opened_at:
+        if self.state is CircuitState.OPEN and self.opened_at:
             elapsed = datetime.now() - self.opened_at
             if elapsed > timedelta(minutes=self.cooldown_minutes):
                 self.state = CircuitState.HALF_OPEN
@@ -291,6 +413,8 @@ class RiskEngine:
         self.loss_tracker = LossTracker()
         
         self.kill_switch_active = False
+        self.kill_switch_activated_at: Optional[datetime] = None
+        self._kill_switch_time_iso: Optional[str] = None  # formatted once, served by get_status
         self._pending_approvals: Dict[str, Order] = {}
     
     async def check_order(
@@ -305,7 +429,7 @@ class RiskEngine:
         
         Returns RiskCheckResult with action and details.
         """
-        passed = []
+        passed = 0
         failed = []
         warnings = []
         
@@ -313,9 +437,7 @@ class RiskEngine:
         if self.kill_switch_active:
             return RiskCheckResult(
                 action=RiskAction.REJECT,
-                checks_passed=[],
                 checks_failed=["KILL_SWITCH_ACTIVE"],
-                warnings=[]
             )
         
         # Circuit breaker check
@@ -323,106 +445,116 @@ class RiskEngine:
         if not can_trade:
             return RiskCheckResult(
                 action=RiskAction.REJECT,
-                checks_passed=[],
                 checks_failed=[f"CIRCUIT_BREAKER: {cb_reason}"],
-                warnings=[]
             )
         if cb_reason:
             warnings.append(cb_reason)
         
+        # Bind hot attributes to locals once per check
+        limits = self.limits
+        daily_pnl = self.loss_tracker.daily_pnl
+        weekly_pnl = self.loss_tracker.weekly_pnl
+        is_buy = order.side == "buy"
         notional = order.notional(market_price)
         
         # Symbol checks
-        if self.limits.allowed_symbols and order.symbol not in self.limits.allowed_symbols:
+        if limits.allowed_symbols and order.symbol not in limits.allowed_symbols:
             failed.append(f"SYMBOL_NOT_ALLOWED: {order.symbol}")
         else:
-            passed.append("symbol_allowlist")
+            passed |= _SYMBOL_ALLOWLIST
         
-        if order.symbol in self.limits.blocked_symbols:
+        prefixes = limits.blocked_symbol_prefixes
+        pattern = limits._blocked_symbol_regex
+        if order.symbol in limits.blocked_symbols or (
+            prefixes and order.symbol.startswith(prefixes)
+        ) or (
+            pattern is not None and pattern.match(order.symbol)
+        ):
             failed.append(f"SYMBOL_BLOCKED: {order.symbol}")
         else:
-            passed.append("symbol_blocklist")
+            passed |= _SYMBOL_BLOCKLIST
         
         # Order size checks
-        if notional > self.limits.max_order_notional:
-            failed.append(f"ORDER_NOTIONAL_EXCEEDED: ${notional} > ${self.limits.max_order_notional}")
+        if notional > limits.max_order_notional:
+            failed.append(f"ORDER_NOTIONAL_EXCEEDED: ${notional} > ${limits.max_order_notional}")
         else:
-            passed.append("order_notional")
+            passed |= _ORDER_NOTIONAL
         
-        if order.qty > self.limits.max_order_shares:
-            failed.append(f"ORDER_SHARES_EXCEEDED: {order.qty} > {self.limits.max_order_shares}")
+        if order.qty > limits.max_order_shares:
+            failed.append(f"ORDER_SHARES_EXCEEDED: {order.qty} > {limits.max_order_shares}")
         else:
-            passed.append("order_shares")
+            passed |= _ORDER_SHARES
         
         # Position limits
         current_position = positions.get(order.symbol)
         current_qty = current_position.qty if current_position else 0
-        new_qty = current_qty + order.qty if order.side == "buy" else current_qty - order.qty
+        new_qty = current_qty + order.qty if is_buy else current_qty - order.qty
         
-        if abs(new_qty) > self.limits.max_position_shares:
-            failed.append(f"POSITION_SHARES_EXCEEDED: {abs(new_qty)} > {self.limits.max_position_shares}")
+        new_abs_qty = abs(new_qty)
+        if new_abs_qty > limits.max_position_shares:
+            failed.append(f"POSITION_SHARES_EXCEEDED: {new_abs_qty} > {limits.max_position_shares}")
         else:
-            passed.append("position_shares")
+            passed |= _POSITION_SHARES
         
-        new_position_value = abs(new_qty) * market_price
-        if new_position_value > self.limits.max_position_notional:
-            failed.append(f"POSITION_NOTIONAL_EXCEEDED: ${new_position_value} > ${self.limits.max_position_notional}")
+        new_position_value = new_abs_qty * market_price
+        if new_position_value > limits.max_position_notional:
+            failed.append(f"POSITION_NOTIONAL_EXCEEDED: ${new_position_value} > ${limits.max_position_notional}")
         else:
-            passed.append("position_notional")
+            passed |= _POSITION_NOTIONAL
         
         # Total exposure check
         total_exposure = sum(p.market_value for p in positions.values())
-        if order.side == "buy":
+        if is_buy:
             total_exposure += notional
         
-        if total_exposure > self.limits.max_total_exposure:
-            failed.append(f"TOTAL_EXPOSURE_EXCEEDED: ${total_exposure} > ${self.limits.max_total_exposure}")
+        if total_exposure > limits.max_total_exposure:
+            failed.append(f"TOTAL_EXPOSURE_EXCEEDED: ${total_exposure} > ${limits.max_total_exposure}")
         else:
-            passed.append("total_exposure")
+            passed |= _TOTAL_EXPOSURE
         
-        # Concentration check
+        # Concentration check (cross-multiplied; only divide to report a failure)
         if account_equity and account_equity > 0:
-            concentration = new_position_value / account_equity
-            if concentration > self.limits.max_concentration_pct:
-                failed.append(f"CONCENTRATION_EXCEEDED: {concentration:.1%} > {self.limits.max_concentration_pct:.0%}")
+            if new_position_value > account_equity * limits.max_concentration_pct:
+                concentration = new_position_value / account_equity
+                failed.append(f"CONCENTRATION_EXCEEDED: {concentration:.1%} > {limits.max_concentration_pct:.0%}")
             else:
-                passed.append("concentration")
+                passed |= _CONCENTRATION
         
         # Loss limit checks
-        if self.loss_tracker.daily_pnl < -self.limits.max_daily_loss:
-            failed.append(f"DAILY_LOSS_LIMIT: ${abs(self.loss_tracker.daily_pnl)} > ${self.limits.max_daily_loss}")
+        if daily_pnl < -limits.max_daily_loss:
+            failed.append(f"DAILY_LOSS_LIMIT: ${abs(daily_pnl)} > ${limits.max_daily_loss}")
         else:
-            passed.append("daily_loss_limit")
+            passed |= _DAILY_LOSS_LIMIT
         
-        if self.loss_tracker.weekly_pnl < -self.limits.max_weekly_loss:
-            failed.append(f"WEEKLY_LOSS_LIMIT: ${abs(self.loss_tracker.weekly_pnl)} > ${self.limits.max_weekly_loss}")
+        if weekly_pnl < -limits.max_weekly_loss:
+            failed.append(f"WEEKLY_LOSS_LIMIT: ${abs(weekly_pnl)} > ${limits.max_weekly_loss}")
         else:
-            passed.append("weekly_loss_limit")
+            passed |= _WEEKLY_LOSS_LIMIT
         
         drawdown = self.loss_tracker.get_drawdown_pct()
-        if drawdown > self.limits.max_drawdown_pct:
-            failed.append(f"DRAWDOWN_LIMIT: {drawdown:.1%} > {self.limits.max_drawdown_pct:.0%}")
+        if drawdown > limits.max_drawdown_pct:
+            failed.append(f"DRAWDOWN_LIMIT: {drawdown:.1%} > {limits.max_drawdown_pct:.0%}")
         else:
-            passed.append("drawdown_limit")
+            passed |= _DRAWDOWN_LIMIT
         
         # Spend limit checks (only for buys)
-        if order.side == "buy":
-            remaining = self.spend_tracker.get_remaining(self.limits)
+        if is_buy:
+            remaining = self.spend_tracker.get_remaining(limits)
             
             if notional > remaining["daily"]:
                 failed.append(f"DAILY_SPEND_LIMIT: ${notional} > ${remaining['daily']} remaining")
             else:
-                passed.append("daily_spend_limit")
+                passed |= _DAILY_SPEND_LIMIT
             
             if notional > remaining["weekly"]:
                 failed.append(f"WEEKLY_SPEND_LIMIT: ${notional} > ${remaining['weekly']} remaining")
             else:
-                passed.append("weekly_spend_limit")
+                passed |= _WEEKLY_SPEND_LIMIT
             
             if notional > remaining["monthly"]:
                 failed.append(f"MONTHLY_SPEND_LIMIT: ${notional} > ${remaining['monthly']} remaining")
             else:
-                passed.append("monthly_spend_limit")
+                passed |= _MONTHLY_SPEND_LIMIT
         
         # Determine action
         if failed:
@@ -433,10 +565,10 @@ class RiskEngine:
             # Check if approval required
             approval_reason = None
             
-            if notional > self.limits.approval_notional_threshold:
+            if notional > limits.approval_notional_threshold:
                 approval_reason = f"Large order: ${notional}"
-            elif self.loss_tracker.daily_pnl < -self.limits.approval_loss_threshold:
-                approval_reason = f"Trading while down ${abs(self.loss_tracker.daily_pnl)}"
+            elif daily_pnl < -limits.approval_loss_threshold:
+                approval_reason = f"Trading while down ${abs(daily_pnl)}"
             
             if approval_reason:
                 action = RiskAction.REQUIRE_APPROVAL
@@ -445,14 +577,14 @@ class RiskEngine:
         
         return RiskCheckResult(
             action=action,
-            checks_passed=passed,
-            checks_failed=failed,
-            warnings=warnings,
-            approval_reason=approval_reason if action == RiskAction.REQUIRE_APPROVAL else None,
+            checks_passed=_passed_check_names(passed),
+            checks_failed=failed or _EMPTY,
+            warnings=warnings or _EMPTY,
+            approval_reason=approval_reason if action is RiskAction.REQUIRE_APPROVAL else None,
             metadata={
                 "notional": str(notional),
                 "market_price": str(market_price),
-                "daily_pnl": str(self.loss_tracker.daily_pnl),
+                "daily_pnl": str(daily_pnl),
                 "drawdown_pct": str(drawdown),
             }
         )
@@ -474,16 +606,22 @@ class RiskEngine:
         """Activate kill switch to halt all trading."""
         logger.critical(f"KILL SWITCH ACTIVATED: {reason}")
         self.kill_switch_active = True
+        self.kill_switch_activated_at = datetime.now()
+        self._kill_switch_time_iso = self.kill_switch_activated_at.isoformat()
     
     def deactivate_kill_switch(self):
         """Deactivate kill switch to resume trading."""
         logger.warning("Kill switch deactivated")
         self.kill_switch_active = False
+        self.kill_switch_activated_at = None
+        self._kill_switch_time_iso = None
     
     def get_status(self) -> Dict[str, Any]:
         """Get current risk engine status."""
+        limits = self.limits.to_dict()
         return {
             "kill_switch": self.kill_switch_active,
+            "kill_switch_activated_at": self._kill_switch_time_iso,
             "circuit_breaker": self.circuit_breaker.state.value,
             "dry_run": self.dry_run,
             "daily_pnl": str(self.loss_tracker.daily_pnl),
@@ -494,9 +632,8 @@ class RiskEngine:
                 self.spend_tracker.get_remaining(self.limits).items()
             },
             "limits": {
-                "max_order_notional": str(self.limits.max_order_notional),
-                "max_position_notional": str(self.limits.max_position_notional),
-                "max_daily_loss": str(self.limits.max_daily_loss),
+                key: limits[key]
+                for key in ("max_order_notional", "max_position_notional", "max_daily_loss")
             }
         }
 
@@ -0,0 +1,28 @@
+"""
+Fixed-Point Money Helpers
+
+Hot paths in the risk package (P&L tracking, position sizing) keep money
+as integer micro-dollars so per-call arithmetic is plain int math.
+Decimal is only produced at the API boundary.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+# Fixed-point units per dollar (micro-dollars; keeps sub-penny prices exact)
+SCALE = 1_000_000
+_D_SCALE = Decimal(SCALE)
+
+
+def to_units(value: Any) -> int:
+    """Convert a dollar amount (Decimal, int, float or str) to fixed-point units."""
+    if type(value) is int:
+        return value * SCALE
+    if isinstance(value, str):
+        value = Decimal(value)
+    return round(value * SCALE)
+
+
+def to_decimal(units: int) -> Decimal:
+    """Convert fixed-point units back to a Decimal dollar amount."""
+    return Decimal(units) / _D_SCALE
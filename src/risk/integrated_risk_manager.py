@@ -15,9 +15,9 @@ import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional, Dict, List, Any, Callable, Awaitable
+from typing import Optional, Dict, List, Any, Callable, Awaitable, Tuple
 
-from .engine import RiskEngine, RiskLimits, RiskCheckResult, RiskAction
+from .engine import RiskEngine, RiskLimits, RiskCheckResult, RiskAction, Position
 from .position_sizing import (
     PositionSizer, SizingMethod, TradeStats, PositionSizeResult
 )
@@ -157,6 +157,8 @@ class IntegratedRiskManager:
         # State
         self._current_equity = self.config.account_equity
         self._current_positions: Dict[str, Dict] = {}
+        # symbol -> (raw position fields, risk engine Position built from them)
+        self._engine_position_cache: Dict[str, Tuple[tuple, Position]] = {}
         self._trade_stats: Optional[TradeStats] = None
         
         # Trading state
@@ -384,19 +386,7 @@ class IntegratedRiskManager:
                 )
         
         # Check 5: Core risk engine checks
-        from .engine import Order as RiskOrder, Position
-        
-        # Build positions dict for risk engine
-        positions = {}
-        for sym, pos in self._current_positions.items():
-            positions[sym] = Position(
-                symbol=sym,
-                qty=pos.get("qty", 0),
-                avg_entry_price=Decimal(str(pos.get("avg_entry_price", 0))),
-                current_price=Decimal(str(pos.get("current_price", 0))),
-                market_value=Decimal(str(pos.get("market_value", 0))),
-                unrealized_pnl=Decimal(str(pos.get("unrealized_pnl", 0))),
-            )
+        from .engine import Order as RiskOrder
         
         risk_order = RiskOrder(
             symbol=symbol,
@@ -408,7 +398,7 @@ class IntegratedRiskManager:
         
         risk_check = await self.risk_engine.check_order(
             order=risk_order,
-            positions=positions,
+            positions=self._get_engine_positions(),
             market_price=entry_price,
             account_equity=self._current_equity,
         )
@@ -486,6 +476,43 @@ class IntegratedRiskManager:
                         f"due to {drawdown_state.level.value}"
                     )
     
+    def _get_engine_positions(self) -> Dict[str, Position]:
+        """
+        Risk engine positions for the current position dicts.
+        
+        Callers may edit their position dicts in place between
+        update_state calls, so each check compares the raw fields and
+        only re-parses positions whose fields changed.
+        """
+        cache = self._engine_position_cache
+        positions: Dict[str, Position] = {}
+        for sym, pos in self._current_positions.items():
+            raw = (
+                pos.get("qty", 0),
+                pos.get("avg_entry_price", 0),
+                pos.get("current_price", 0),
+                pos.get("market_value", 0),
+                pos.get("unrealized_pnl", 0),
+            )
+            cached = cache.get(sym)
+            if cached is None or cached[0] != raw:
+                qty, avg_entry_price, current_price, market_value, unrealized_pnl = raw
+                cached = cache[sym] = (raw, Position(
+                    symbol=sym,
+                    qty=qty,
+                    avg_entry_price=Decimal(str(avg_entry_price)),
+                    current_price=Decimal(str(current_price)),
+                    market_value=Decimal(str(market_value)),
+                    unrealized_pnl=Decimal(str(unrealized_pnl)),
+                ))
+            positions[sym] = cached[1]
+        
+        # Drop closed positions
+        if len(cache) > len(positions):
+            for sym in cache.keys() - positions.keys():
+                del cache[sym]
+        return positions
+    
     def get_liquidation_orders(self) -> List[LiquidationOrder]:
         """Get liquidation orders if drawdown protection triggered."""
         return self.drawdown_protector.get_liquidation_orders(
@@ -553,7 +580,7 @@ class IntegratedRiskManager:
             },
             "diversification": diversification,
             "risk_engine": self.risk_engine.get_status(),
-            "pending_alerts": len(self.pnl_tracker.get_alerts()),
+            "pending_alerts": self.pnl_tracker.get_unacknowledged_count(),
         }
     
     def get_alerts(self) -> List[PnLAlert]:
@@ -9,17 +9,38 @@ Implements:
 """
 
 import asyncio
+import heapq
 import logging
+import operator
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Optional, Dict, List, Callable, Any, Awaitable
+from typing import Optional, Dict, List, Set, Mapping, Callable, Awaitable, Tuple
 from enum import Enum
+from types import MappingProxyType
 from collections import deque
-import json
+
+from .fixed_point import to_units, to_decimal
 
 logger = logging.getLogger(__name__)
 
+# Money is tracked internally as integer fixed-point units (see fixed_point)
+# so the per-tick path is plain int arithmetic; Decimal only appears at the
+# API boundary (PortfolioPnL, alerts, to_dict).
+_ZERO = Decimal(0)
+
+# The equity history ring buffer is sized to hold a full velocity window
+# at up to this many updates per second, plus some slack
+_EXPECTED_MAX_UPDATE_HZ = 10
+_PNL_HISTORY_SLACK = 64
+
+# Max alerts retained for get_alerts(); the oldest are dropped first
+_MAX_PENDING_ALERTS = 1000
+
+# Max age of the last full evaluation for an unchanged update to be skipped
+_UNCHANGED_SKIP_WINDOW = timedelta(seconds=1)
+
 
 class AlertType(Enum):
     """Types of P&L alerts."""
@@ -44,7 +65,7 @@ class AlertPriority(Enum):
     CRITICAL = 4
 
 
-@dataclass
+@dataclass(slots=True)
 class PnLAlert:
     """A P&L alert."""
     alert_type: AlertType
@@ -69,7 +90,7 @@ class PnLAlert:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class AlertConfig:
     """Configuration for P&L alerts."""
     # Daily targets/limits (absolute)
@@ -104,25 +125,75 @@ class AlertConfig:
     cooldown_minutes: int = 15                        # Min time between same alert type
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionPnL:
-    """P&L tracking for a single position."""
+    """
+    P&L tracking for a single position.
+    
+    Prices and P&L amounts are stored as integer fixed-point units in the
+    *_u fields (see fixed_point); the same-named properties without the
+    suffix return Decimal dollars, as before.
+    """
     symbol: str
     qty: int
     side: str
-    entry_price: Decimal
-    current_price: Decimal
-    unrealized_pnl: Decimal
+    entry_price_u: int
+    current_price_u: int
+    unrealized_pnl_u: int
     unrealized_pnl_pct: float
-    realized_pnl: Decimal
-    total_pnl: Decimal
-    high_pnl: Decimal  # Best P&L reached
-    low_pnl: Decimal   # Worst P&L reached
+    realized_pnl_u: int
+    total_pnl_u: int
+    high_pnl_u: int  # Best P&L reached
+    low_pnl_u: int   # Worst P&L reached
     entry_time: datetime
     last_update: datetime
+    is_long: bool = True  # side == "long", precomputed for the update loop
+    
+    @property
+    def entry_price(self) -> Decimal:
+        return to_decimal(self.entry_price_u)
+    
+    @property
+    def current_price(self) -> Decimal:
+        return to_decimal(self.current_price_u)
+    
+    @property
+    def unrealized_pnl(self) -> Decimal:
+        return to_decimal(self.unrealized_pnl_u)
+    
+    @property
+    def realized_pnl(self) -> Decimal:
+        return to_decimal(self.realized_pnl_u)
+    
+    @property
+    def total_pnl(self) -> Decimal:
+        return to_decimal(self.total_pnl_u)
+    
+    @property
+    def high_pnl(self) -> Decimal:
+        return to_decimal(self.high_pnl_u)
+    
+    @property
+    def low_pnl(self) -> Decimal:
+        return to_decimal(self.low_pnl_u)
+    
+    def to_dict(self) -> Dict:
+        return {
+            "symbol": self.symbol,
+            "qty": self.qty,
+            "side": self.side,
+            "entry_price": str(self.entry_price),
+            "current_price": str(self.current_price),
+            "unrealized_pnl": str(self.unrealized_pnl),
+            "unrealized_pnl_pct": f"{self.unrealized_pnl_pct:.2%}",
+            "realized_pnl": str(self.realized_pnl),
+            "total_pnl": str(self.total_pnl),
+            "high_pnl": str(self.high_pnl),
+            "low_pnl": str(self.low_pnl),
+        }
 
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioPnL:
     """Portfolio-level P&L summary."""
     # Current state
@@ -200,6 +271,10 @@ class PnLTracker:
         
         # Get pending alerts
         alerts = tracker.get_alerts()
+    
+    Alerts raised during an update() are delivered once the update
+    completes: as a single list to on_alert_batch if given, otherwise to
+    on_alert, with the callbacks for that update run concurrently.
     """
     
     def __init__(
@@ -207,19 +282,72 @@ class PnLTracker:
         config: Optional[AlertConfig] = None,
         initial_equity: Decimal = Decimal("0"),
         on_alert: Optional[Callable[[PnLAlert], Awaitable[None]]] = None,
+        on_alert_batch: Optional[Callable[[List[PnLAlert]], Awaitable[None]]] = None,
     ):
         self.config = config or AlertConfig()
         self._on_alert = on_alert
+        self._on_alert_batch = on_alert_batch
+        
+        # Thresholds in fixed-point units (loss limits pre-negated)
+        cfg = self.config
+        self._daily_profit_target_u = to_units(cfg.daily_profit_target)
+        self._neg_daily_loss_limit_u = -to_units(cfg.daily_loss_limit)
+        self._position_profit_abs_u = to_units(cfg.position_profit_abs)
+        self._neg_position_loss_abs_u = -to_units(cfg.position_loss_abs)
+        self._neg_position_loss_pct = -cfg.position_loss_pct
+        self._neg_losing_streak_threshold = -cfg.losing_streak_threshold
+        
+        # Decimal forms of float/int thresholds reported on alerts
+        self._d_daily_profit_target_pct = Decimal(str(cfg.daily_profit_target_pct))
+        self._d_position_profit_pct = Decimal(str(cfg.position_profit_pct))
+        self._d_position_loss_pct = Decimal(str(cfg.position_loss_pct))
+        self._d_losing_streak_threshold = Decimal(cfg.losing_streak_threshold)
+        self._d_winning_streak_threshold = Decimal(cfg.winning_streak_threshold)
+        self._d_velocity_threshold_pct = Decimal(str(cfg.velocity_threshold_pct))
+        self._d_drawdown_warning_pct = Decimal(str(cfg.drawdown_warning_pct))
+        self._d_recovery_milestones = {
+            m: Decimal(str(m)) for m in cfg.recovery_milestones
+        }
+        
+        # Threshold alert specs, evaluated by _check_alert_specs:
+        # (type, priority, compare pct?, op, limit, reported threshold, message)
+        self._portfolio_alert_specs = (
+            (AlertType.DAILY_PROFIT_TARGET, AlertPriority.MEDIUM, False, operator.ge,
+             self._daily_profit_target_u, cfg.daily_profit_target,
+             "🎯 Daily profit target hit: ${pnl:.2f}"),
+            (AlertType.DAILY_PROFIT_TARGET, AlertPriority.MEDIUM, True, operator.ge,
+             cfg.daily_profit_target_pct, self._d_daily_profit_target_pct,
+             "🎯 Daily profit target hit: {pct:.1%}"),
+            (AlertType.DAILY_LOSS_LIMIT, AlertPriority.HIGH, False, operator.le,
+             self._neg_daily_loss_limit_u, cfg.daily_loss_limit,
+             "⚠️ Daily loss limit hit: ${abs_pnl:.2f}"),
+        )
+        self._position_alert_specs = (
+            (AlertType.POSITION_PROFIT, AlertPriority.LOW, True, operator.ge,
+             cfg.position_profit_pct, self._d_position_profit_pct,
+             "📈 {symbol} up {pct:.1%} (${pnl:.2f})"),
+            (AlertType.POSITION_PROFIT, AlertPriority.LOW, False, operator.ge,
+             self._position_profit_abs_u, cfg.position_profit_abs,
+             "📈 {symbol} profit: ${pnl:.2f}"),
+            (AlertType.POSITION_LOSS, AlertPriority.MEDIUM, True, operator.le,
+             self._neg_position_loss_pct, self._d_position_loss_pct,
+             "📉 {symbol} down {abs_pct:.1%} (${abs_pnl:.2f})"),
+            (AlertType.POSITION_LOSS, AlertPriority.MEDIUM, False, operator.le,
+             self._neg_position_loss_abs_u, cfg.position_loss_abs,
+             "📉 {symbol} loss: ${abs_pnl:.2f}"),
+        )
         
-        # State
-        self._current_equity = initial_equity
-        self._peak_equity = initial_equity
-        self._daily_start_equity = initial_equity
+        # State (fixed-point units)
+        initial_u = to_units(initial_equity)
+        self._current_equity = initial_u
+        self._peak_equity = initial_u
+        self._daily_start_equity = initial_u
         
         # P&L tracking
-        self._total_realized_pnl = Decimal("0")
-        self._daily_realized_pnl = Decimal("0")
+        self._total_realized_pnl = 0
+        self._daily_realized_pnl = 0
         self._position_pnl: Dict[str, PositionPnL] = {}
+        self._total_unrealized = 0  # Sum of unrealized_pnl_u over _position_pnl
         
         # Trade tracking
         self._winning_trades = 0
@@ -228,61 +356,142 @@ class PnLTracker:
         self._best_winning_streak = 0
         self._worst_losing_streak = 0
         
-        # Velocity tracking
-        self._pnl_history: deque = deque(maxlen=100)
+        # Velocity tracking: parallel ring buffers of epoch seconds and
+        # equity units, oldest entry at (_hist_head - _hist_count)
+        self._hist_cap = (
+            cfg.velocity_window_minutes * 60 * _EXPECTED_MAX_UPDATE_HZ
+            + _PNL_HISTORY_SLACK
+        )
+        self._hist_ts: List[float] = [0.0] * self._hist_cap
+        self._hist_equity: List[int] = [0] * self._hist_cap
+        self._hist_head = 0
+        self._hist_count = 0
         
         # Alert tracking
-        self._pending_alerts: List[PnLAlert] = []
+        self._pending_alerts: deque = deque(maxlen=_MAX_PENDING_ALERTS)
+        self._alert_batch: List[PnLAlert] = []
         self._alert_cooldowns: Dict[str, datetime] = {}
+        self._cooldown_heap: List[tuple] = []  # (expiry, key) min-heap
         
         # Recovery tracking
         self._in_drawdown = False
-        self._drawdown_low: Optional[Decimal] = None
+        self._drawdown_low: Optional[int] = None
         self._recovery_alerts_sent: Set[float] = set()
         
         # Timestamps
-        self._daily_reset = datetime.now().replace(hour=0, minute=0, second=0)
-        self._last_update = datetime.now()
+        now = datetime.now()
+        self._set_daily_reset(now)
+        self._last_update = now
+        self._cooldown_delta = timedelta(minutes=self.config.cooldown_minutes)
+        
+        # Unchanged-update short circuit
+        self._last_state_key: Optional[tuple] = None
+        self._last_full_update = datetime.min
+    
+    def _set_daily_reset(self, now: datetime):
+        """Record today's reset time and precompute the next midnight."""
+        self._daily_reset = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        self._next_daily_reset = self._daily_reset + timedelta(days=1)
     
-    def _check_daily_reset(self):
+    def _check_daily_reset(self, now: datetime):
         """Check and reset daily trackers."""
-        now = datetime.now()
-        if now >= self._daily_reset + timedelta(days=1):
-            self._daily_realized_pnl = Decimal("0")
+        if now >= self._next_daily_reset:
+            self._daily_realized_pnl = 0
             self._daily_start_equity = self._current_equity
-            self._daily_reset = now.replace(hour=0, minute=0, second=0)
+            self._set_daily_reset(now)
             self._recovery_alerts_sent.clear()
             logger.info("Daily P&L tracker reset")
     
-    def _can_send_alert(self, alert_type: AlertType, symbol: Optional[str] = None) -> bool:
+    def _can_send_alert(
+        self, alert_type: AlertType, symbol: Optional[str], now: datetime
+    ) -> bool:
         """Check if alert can be sent (cooldown check)."""
         key = f"{alert_type.value}:{symbol or 'portfolio'}"
         
         if key in self._alert_cooldowns:
-            if datetime.now() < self._alert_cooldowns[key]:
+            if now < self._alert_cooldowns[key]:
                 return False
         
         return True
     
-    def _record_alert_sent(self, alert_type: AlertType, symbol: Optional[str] = None):
+    def _record_alert_sent(
+        self, alert_type: AlertType, symbol: Optional[str], now: datetime
+    ):
         """Record that an alert was sent."""
         key = f"{alert_type.value}:{symbol or 'portfolio'}"
-        self._alert_cooldowns[key] = datetime.now() + timedelta(
-            minutes=self.config.cooldown_minutes
-        )
+        expiry = now + self._cooldown_delta
+        self._alert_cooldowns[key] = expiry
+        heapq.heappush(self._cooldown_heap, (expiry, key))
+    
+    def _expire_cooldowns(self, now: datetime) -> bool:
+        """Drop cooldowns that have lapsed; return True if any did."""
+        heap = self._cooldown_heap
+        if not heap or heap[0][0] > now:
+            return False
+        cooldowns = self._alert_cooldowns
+        while heap and heap[0][0] <= now:
+            expiry, key = heapq.heappop(heap)
+            if cooldowns.get(key) == expiry:
+                del cooldowns[key]
+        return True
+    
+    def _record_history(self, ts: float, equity_u: int):
+        """Append an equity sample to the ring buffer."""
+        head = self._hist_head
+        self._hist_ts[head] = ts
+        self._hist_equity[head] = equity_u
+        self._hist_head = (head + 1) % self._hist_cap
+        if self._hist_count < self._hist_cap:
+            self._hist_count += 1
+    
+    def _velocity_window(self, cutoff: float) -> Optional[Tuple[int, int]]:
+        """
+        Ring indices of the first sample at or after cutoff and the newest
+        sample, or None if the window holds fewer than two samples.
+        """
+        count = self._hist_count
+        if count < 2:
+            return None
+        
+        # Binary search for the first sample inside the window
+        cap = self._hist_cap
+        oldest = (self._hist_head - count) % cap
+        ts = self._hist_ts
+        first = bisect_left(range(count), cutoff, key=lambda i: ts[(oldest + i) % cap])
+        
+        if count - first < 2:
+            return None
+        return (oldest + first) % cap, (self._hist_head - 1) % cap
     
     async def _send_alert(self, alert: PnLAlert):
-        """Send an alert."""
-        if not self._can_send_alert(alert.alert_type, alert.symbol):
-            return
+        """
+        Send an alert.
         
+        Callers check _can_send_alert first so that alerts in cooldown are
+        never built or formatted.
+        """
         self._pending_alerts.append(alert)
-        self._record_alert_sent(alert.alert_type, alert.symbol)
+        self._record_alert_sent(alert.alert_type, alert.symbol, alert.timestamp)
+        
+        self._alert_batch.append(alert)
         
         logger.warning(f"P&L Alert [{alert.priority.name}]: {alert.message}")
+    
+    async def _dispatch_alerts(self):
+        """Deliver alerts raised during the current update."""
+        batch = self._alert_batch
+        if not batch:
+            return
+        self._alert_batch = []
         
-        if self._on_alert:
-            await self._on_alert(alert)
+        if self._on_alert_batch:
+            await self._on_alert_batch(batch)
+        elif self._on_alert:
+            if len(batch) == 1:
+                await self._on_alert(batch[0])
+            else:
+                # Run per-alert callbacks (often network I/O) concurrently
+                await asyncio.gather(*(self._on_alert(alert) for alert in batch))
     
     async def update(
         self,
@@ -294,294 +503,293 @@ class PnLTracker:
         Update P&L tracking with current state.
         
         Should be called frequently (every few seconds during market hours).
+        Calls that repeat the previous inputs within a second of the last
+        full evaluation, with no realized P&L and no cooldown expiring, are
+        skipped.
         """
-        self._check_daily_reset()
         now = datetime.now()
+        self._check_daily_reset(now)
+        
+        cooldown_expired = self._expire_cooldowns(now)
+        
+        state_key = (
+            equity,
+            self._total_realized_pnl,
+            self._current_streak,
+            tuple(
+                (s, p.get("qty"), p.get("current_price"), p.get("unrealized_pnl"))
+                for s, p in positions.items()
+            ),
+        )
+        if (
+            not realized_pnl
+            and state_key == self._last_state_key
+            and now - self._last_full_update < _UNCHANGED_SKIP_WINDOW
+            and not cooldown_expired
+        ):
+            self._last_update = now
+            return
+        self._last_state_key = state_key
+        self._last_full_update = now
         
         # Update equity
-        prev_equity = self._current_equity
-        self._current_equity = equity
+        equity_u = to_units(equity)
+        self._current_equity = equity_u
         
         # Update peak
-        if equity > self._peak_equity:
-            self._peak_equity = equity
+        if equity_u > self._peak_equity:
+            self._peak_equity = equity_u
             
             # Check for new high alert
             if self._in_drawdown:
                 self._in_drawdown = False
-                await self._send_alert(PnLAlert(
-                    alert_type=AlertType.NEW_HIGH,
-                    priority=AlertPriority.MEDIUM,
-                    message=f"New equity high: ${equity}",
-                    value=equity,
-                    threshold=self._peak_equity,
-                    symbol=None,
-                ))
+                if self._can_send_alert(AlertType.NEW_HIGH, None, now):
+                    await self._send_alert(PnLAlert(
+                        alert_type=AlertType.NEW_HIGH,
+                        priority=AlertPriority.MEDIUM,
+                        message=f"New equity high: ${equity}",
+                        value=equity,
+                        threshold=to_decimal(self._peak_equity),
+                        symbol=None,
+                        timestamp=now,
+                    ))
         
         # Track P&L history for velocity calculation
-        self._pnl_history.append({
-            "timestamp": now,
-            "equity": equity,
-        })
+        self._record_history(now.timestamp(), equity_u)
         
         # Update realized P&L
-        if realized_pnl != Decimal("0"):
-            self._total_realized_pnl += realized_pnl
-            self._daily_realized_pnl += realized_pnl
-            
-            # Update streaks
-            if realized_pnl > 0:
-                self._winning_trades += 1
-                if self._current_streak >= 0:
-                    self._current_streak += 1
-                else:
-                    self._current_streak = 1
-                self._best_winning_streak = max(self._best_winning_streak, self._current_streak)
-            else:
-                self._losing_trades += 1
-                if self._current_streak <= 0:
-                    self._current_streak -= 1
-                else:
-                    self._current_streak = -1
-                self._worst_losing_streak = min(self._worst_losing_streak, self._current_streak)
+        if realized_pnl:
+            self._apply_realized(to_units(realized_pnl))
         
         # Update position P&L
+        update_position = self._update_position_pnl
         for symbol, pos in positions.items():
-            await self._update_position_pnl(symbol, pos)
+            await update_position(symbol, pos, now)
         
         # Remove closed positions
-        closed = set(self._position_pnl.keys()) - set(positions.keys())
+        position_pnl = self._position_pnl
+        closed = [s for s in position_pnl if s not in positions]
         for symbol in closed:
-            del self._position_pnl[symbol]
+            self._total_unrealized -= position_pnl.pop(symbol).unrealized_pnl_u
         
         # Check alerts
-        await self._check_portfolio_alerts()
-        await self._check_streak_alerts()
-        await self._check_velocity_alerts()
-        await self._check_drawdown_alerts()
-        await self._check_recovery_alerts()
+        await self._check_portfolio_alerts(now)
+        await self._check_streak_alerts(now)
+        await self._check_velocity_alerts(now)
+        await self._check_drawdown_alerts(now)
+        await self._check_recovery_alerts(now)
+        await self._dispatch_alerts()
         
         self._last_update = now
     
-    async def _update_position_pnl(self, symbol: str, pos: Dict):
+    async def _update_position_pnl(self, symbol: str, pos: Dict, now: datetime):
         """Update P&L for a single position."""
-        unrealized_pnl = Decimal(str(pos.get("unrealized_pnl", 0)))
-        entry_price = Decimal(str(pos.get("entry_price", pos.get("avg_entry_price", 0))))
-        current_price = Decimal(str(pos.get("current_price", 0)))
-        qty = int(pos.get("qty", 0))
+        unrealized_pnl = to_units(pos.get("unrealized_pnl", 0))
+        entry_price = to_units(pos.get("entry_price", pos.get("avg_entry_price", 0)))
+        current_price = to_units(pos.get("current_price", 0))
+        
         side = pos.get("side", "long")
+        position_pnl = self._position_pnl
+        pos_pnl = position_pnl.get(symbol)
+        if pos_pnl is not None and side == pos_pnl.side:
+            is_long = pos_pnl.is_long  # Side unchanged: reuse the cached flag
+        else:
+            is_long = side == "long"
         
         # Calculate P&L percentage
         if entry_price > 0:
-            if side == "long":
-                pnl_pct = float((current_price - entry_price) / entry_price)
-            else:
-                pnl_pct = float((entry_price - current_price) / entry_price)
+            pnl_pct = (current_price - entry_price) / entry_price
+            if not is_long:
+                pnl_pct = -pnl_pct
         else:
             pnl_pct = 0.0
         
-        if symbol in self._position_pnl:
+        if pos_pnl is not None:
             # Update existing
-            pos_pnl = self._position_pnl[symbol]
-            pos_pnl.current_price = current_price
-            pos_pnl.unrealized_pnl = unrealized_pnl
+            self._total_unrealized += unrealized_pnl - pos_pnl.unrealized_pnl_u
+            if side != pos_pnl.side:
+                # Position reversed since the last update
+                pos_pnl.side = side
+                pos_pnl.is_long = is_long
+            pos_pnl.current_price_u = current_price
+            pos_pnl.unrealized_pnl_u = unrealized_pnl
             pos_pnl.unrealized_pnl_pct = pnl_pct
-            pos_pnl.high_pnl = max(pos_pnl.high_pnl, unrealized_pnl)
-            pos_pnl.low_pnl = min(pos_pnl.low_pnl, unrealized_pnl)
-            pos_pnl.last_update = datetime.now()
+            pos_pnl.high_pnl_u = max(pos_pnl.high_pnl_u, unrealized_pnl)
+            pos_pnl.low_pnl_u = min(pos_pnl.low_pnl_u, unrealized_pnl)
+            pos_pnl.last_update = now
         else:
             # New position
-            self._position_pnl[symbol] = PositionPnL(
+            self._total_unrealized += unrealized_pnl
+            pos_pnl = position_pnl[symbol] = PositionPnL(
                 symbol=symbol,
-                qty=qty,
+                qty=int(pos.get("qty", 0)),
                 side=side,
-                entry_price=entry_price,
-                current_price=current_price,
-                unrealized_pnl=unrealized_pnl,
+                entry_price_u=entry_price,
+                current_price_u=current_price,
+                unrealized_pnl_u=unrealized_pnl,
                 unrealized_pnl_pct=pnl_pct,
-                realized_pnl=Decimal("0"),
-                total_pnl=unrealized_pnl,
-                high_pnl=unrealized_pnl,
-                low_pnl=unrealized_pnl,
-                entry_time=datetime.now(),
-                last_update=datetime.now(),
+                realized_pnl_u=0,
+                total_pnl_u=unrealized_pnl,
+                high_pnl_u=unrealized_pnl,
+                low_pnl_u=unrealized_pnl,
+                entry_time=now,
+                last_update=now,
+                is_long=is_long,
             )
         
-        # Check position alerts
-        await self._check_position_alerts(symbol)
+        # Check position alerts only when a threshold is crossed
+        if not (
+            self._neg_position_loss_pct < pnl_pct < self.config.position_profit_pct
+            and self._neg_position_loss_abs_u < unrealized_pnl < self._position_profit_abs_u
+        ):
+            await self._check_position_alerts(pos_pnl, now)
     
-    async def _check_portfolio_alerts(self):
-        """Check for portfolio-level P&L alerts."""
-        daily_pnl = self._current_equity - self._daily_start_equity
-        
-        # Daily profit target
-        if daily_pnl >= self.config.daily_profit_target:
-            await self._send_alert(PnLAlert(
-                alert_type=AlertType.DAILY_PROFIT_TARGET,
-                priority=AlertPriority.MEDIUM,
-                message=f"🎯 Daily profit target hit: ${daily_pnl:.2f}",
-                value=daily_pnl,
-                threshold=self.config.daily_profit_target,
-                symbol=None,
-            ))
+    async def _check_alert_specs(
+        self,
+        specs: tuple,
+        pnl_u: int,
+        pnl_pct: Optional[float],
+        symbol: Optional[str],
+        now: datetime,
+    ):
+        """
+        Fire the threshold alerts in specs that pnl_u / pnl_pct trip.
         
-        # Check percentage target
-        if self._daily_start_equity > 0:
-            daily_pnl_pct = float(daily_pnl / self._daily_start_equity)
+        Messages are only formatted for alerts that are out of cooldown.
+        Percentage specs are skipped when pnl_pct is None.
+        """
+        for alert_type, priority, on_pct, op, limit, threshold, template in specs:
+            if on_pct:
+                if pnl_pct is None or not op(pnl_pct, limit):
+                    continue
+            elif not op(pnl_u, limit):
+                continue
+            if not self._can_send_alert(alert_type, symbol, now):
+                continue
             
-            if daily_pnl_pct >= self.config.daily_profit_target_pct:
-                await self._send_alert(PnLAlert(
-                    alert_type=AlertType.DAILY_PROFIT_TARGET,
-                    priority=AlertPriority.MEDIUM,
-                    message=f"🎯 Daily profit target hit: {daily_pnl_pct:.1%}",
-                    value=daily_pnl,
-                    threshold=Decimal(str(self.config.daily_profit_target_pct)),
-                    symbol=None,
-                ))
-        
-        # Daily loss limit
-        if daily_pnl <= -self.config.daily_loss_limit:
-            await self._send_alert(PnLAlert(
-                alert_type=AlertType.DAILY_LOSS_LIMIT,
-                priority=AlertPriority.HIGH,
-                message=f"⚠️ Daily loss limit hit: ${abs(daily_pnl):.2f}",
-                value=daily_pnl,
-                threshold=self.config.daily_loss_limit,
-                symbol=None,
-            ))
-    
-    async def _check_position_alerts(self, symbol: str):
-        """Check for position-level alerts."""
-        if symbol not in self._position_pnl:
-            return
-        
-        pos = self._position_pnl[symbol]
-        
-        # Position profit alert (percentage)
-        if pos.unrealized_pnl_pct >= self.config.position_profit_pct:
+            pnl = to_decimal(pnl_u)
+            pct = pnl_pct or 0.0
             await self._send_alert(PnLAlert(
-                alert_type=AlertType.POSITION_PROFIT,
-                priority=AlertPriority.LOW,
-                message=f"📈 {symbol} up {pos.unrealized_pnl_pct:.1%} (${pos.unrealized_pnl:.2f})",
-                value=pos.unrealized_pnl,
-                threshold=Decimal(str(self.config.position_profit_pct)),
-                symbol=symbol,
-            ))
-        
-        # Position profit alert (absolute)
-        if pos.unrealized_pnl >= self.config.position_profit_abs:
-            await self._send_alert(PnLAlert(
-                alert_type=AlertType.POSITION_PROFIT,
-                priority=AlertPriority.LOW,
-                message=f"📈 {symbol} profit: ${pos.unrealized_pnl:.2f}",
-                value=pos.unrealized_pnl,
-                threshold=self.config.position_profit_abs,
-                symbol=symbol,
-            ))
-        
-        # Position loss alert (percentage)
-        if pos.unrealized_pnl_pct <= -self.config.position_loss_pct:
-            await self._send_alert(PnLAlert(
-                alert_type=AlertType.POSITION_LOSS,
-                priority=AlertPriority.MEDIUM,
-                message=f"📉 {symbol} down {abs(pos.unrealized_pnl_pct):.1%} (${abs(pos.unrealized_pnl):.2f})",
-                value=pos.unrealized_pnl,
-                threshold=Decimal(str(self.config.position_loss_pct)),
+                alert_type=alert_type,
+                priority=priority,
+                message=template.format(
+                    symbol=symbol, pnl=pnl, abs_pnl=abs(pnl), pct=pct, abs_pct=abs(pct),
+                ),
+                value=pnl,
+                threshold=threshold,
                 symbol=symbol,
+                timestamp=now,
             ))
+    
+    async def _check_portfolio_alerts(self, now: datetime):
+        """Check for portfolio-level P&L alerts."""
+        daily_pnl_u = self._current_equity - self._daily_start_equity
+        daily_start = self._daily_start_equity
+        daily_pnl_pct = daily_pnl_u / daily_start if daily_start > 0 else None
         
-        # Position loss alert (absolute)
-        if pos.unrealized_pnl <= -self.config.position_loss_abs:
-            await self._send_alert(PnLAlert(
-                alert_type=AlertType.POSITION_LOSS,
-                priority=AlertPriority.MEDIUM,
-                message=f"📉 {symbol} loss: ${abs(pos.unrealized_pnl):.2f}",
-                value=pos.unrealized_pnl,
-                threshold=self.config.position_loss_abs,
-                symbol=symbol,
-            ))
+        await self._check_alert_specs(
+            self._portfolio_alert_specs, daily_pnl_u, daily_pnl_pct, None, now
+        )
+    
+    async def _check_position_alerts(self, pos: PositionPnL, now: datetime):
+        """Check for position-level alerts."""
+        await self._check_alert_specs(
+            self._position_alert_specs,
+            pos.unrealized_pnl_u,
+            pos.unrealized_pnl_pct,
+            pos.symbol,
+            now,
+        )
     
-    async def _check_streak_alerts(self):
+    async def _check_streak_alerts(self, now: datetime):
         """Check for streak alerts."""
-        if self._current_streak <= -self.config.losing_streak_threshold:
+        if (
+            self._current_streak <= self._neg_losing_streak_threshold
+            and self._can_send_alert(AlertType.LOSING_STREAK, None, now)
+        ):
             await self._send_alert(PnLAlert(
                 alert_type=AlertType.LOSING_STREAK,
                 priority=AlertPriority.HIGH,
                 message=f"🔥 Losing streak: {abs(self._current_streak)} trades in a row",
-                value=Decimal(str(self._current_streak)),
-                threshold=Decimal(str(self.config.losing_streak_threshold)),
+                value=Decimal(self._current_streak),
+                threshold=self._d_losing_streak_threshold,
                 symbol=None,
+                timestamp=now,
             ))
         
-        if self._current_streak >= self.config.winning_streak_threshold:
+        if (
+            self._current_streak >= self.config.winning_streak_threshold
+            and self._can_send_alert(AlertType.WINNING_STREAK, None, now)
+        ):
             await self._send_alert(PnLAlert(
                 alert_type=AlertType.WINNING_STREAK,
                 priority=AlertPriority.LOW,
                 message=f"🔥 Winning streak: {self._current_streak} trades in a row!",
-                value=Decimal(str(self._current_streak)),
-                threshold=Decimal(str(self.config.winning_streak_threshold)),
+                value=Decimal(self._current_streak),
+                threshold=self._d_winning_streak_threshold,
                 symbol=None,
+                timestamp=now,
             ))
     
-    async def _check_velocity_alerts(self):
+    async def _check_velocity_alerts(self, now: datetime):
         """Check for rapid P&L change alerts."""
-        if len(self._pnl_history) < 2:
-            return
-        
-        # Get data from window
-        cutoff = datetime.now() - timedelta(minutes=self.config.velocity_window_minutes)
-        window_data = [
-            d for d in self._pnl_history
-            if d["timestamp"] >= cutoff
-        ]
-        
-        if len(window_data) < 2:
+        window = self._velocity_window(
+            now.timestamp() - self.config.velocity_window_minutes * 60
+        )
+        if window is None:
             return
         
         # Calculate velocity
-        start_equity = window_data[0]["equity"]
-        end_equity = window_data[-1]["equity"]
+        start, end = window
+        start_equity = self._hist_equity[start]
+        end_equity = self._hist_equity[end]
         
         if start_equity > 0:
-            change_pct = abs(float((end_equity - start_equity) / start_equity))
+            change_pct = abs((end_equity - start_equity) / start_equity)
             
-            if change_pct >= self.config.velocity_threshold_pct:
+            if (
+                change_pct >= self.config.velocity_threshold_pct
+                and self._can_send_alert(AlertType.PNL_VELOCITY, None, now)
+            ):
                 direction = "📈 up" if end_equity > start_equity else "📉 down"
                 await self._send_alert(PnLAlert(
                     alert_type=AlertType.PNL_VELOCITY,
                     priority=AlertPriority.MEDIUM,
                     message=f"Rapid P&L change: {direction} {change_pct:.1%} in {self.config.velocity_window_minutes} min",
-                    value=end_equity - start_equity,
-                    threshold=Decimal(str(self.config.velocity_threshold_pct)),
+                    value=to_decimal(end_equity - start_equity),
+                    threshold=self._d_velocity_threshold_pct,
                     symbol=None,
+                    timestamp=now,
                 ))
     
-    async def _check_drawdown_alerts(self):
+    async def _check_drawdown_alerts(self, now: datetime):
         """Check for drawdown alerts."""
         if self._peak_equity <= 0:
             return
         
-        drawdown_pct = float((self._peak_equity - self._current_equity) / self._peak_equity)
+        drawdown_pct = (self._peak_equity - self._current_equity) / self._peak_equity
         
         if drawdown_pct >= self.config.drawdown_warning_pct:
             if not self._in_drawdown:
                 self._in_drawdown = True
                 self._drawdown_low = self._current_equity
             
-            await self._send_alert(PnLAlert(
-                alert_type=AlertType.DRAWDOWN_WARNING,
-                priority=AlertPriority.HIGH,
-                message=f"⚠️ Drawdown warning: {drawdown_pct:.1%} from peak",
-                value=self._peak_equity - self._current_equity,
-                threshold=Decimal(str(self.config.drawdown_warning_pct)),
-                symbol=None,
-            ))
+            if self._can_send_alert(AlertType.DRAWDOWN_WARNING, None, now):
+                await self._send_alert(PnLAlert(
+                    alert_type=AlertType.DRAWDOWN_WARNING,
+                    priority=AlertPriority.HIGH,
+                    message=f"⚠️ Drawdown warning: {drawdown_pct:.1%} from peak",
+                    value=to_decimal(self._peak_equity - self._current_equity),
+                    threshold=self._d_drawdown_warning_pct,
+                    symbol=None,
+                    timestamp=now,
+                ))
             
             # Track lowest point
             if self._current_equity < self._drawdown_low:
                 self._drawdown_low = self._current_equity
     
-    async def _check_recovery_alerts(self):
+    async def _check_recovery_alerts(self, now: datetime):
         """Check for recovery milestone alerts."""
         if not self._in_drawdown or self._drawdown_low is None:
             return
@@ -592,7 +800,7 @@ class PnLTracker:
             return
         
         recovery = self._current_equity - self._drawdown_low
-        recovery_pct = float(recovery / drawdown_depth)
+        recovery_pct = recovery / drawdown_depth
         
         # Check milestones
         for milestone in self.config.recovery_milestones:
@@ -600,58 +808,67 @@ class PnLTracker:
                 self._recovery_alerts_sent.add(milestone)
                 
                 if milestone == 1.0:
-                    await self._send_alert(PnLAlert(
-                        alert_type=AlertType.BREAKEVEN,
-                        priority=AlertPriority.MEDIUM,
-                        message="✅ Back to breakeven from drawdown!",
-                        value=recovery,
-                        threshold=drawdown_depth,
-                        symbol=None,
-                    ))
+                    if self._can_send_alert(AlertType.BREAKEVEN, None, now):
+                        await self._send_alert(PnLAlert(
+                            alert_type=AlertType.BREAKEVEN,
+                            priority=AlertPriority.MEDIUM,
+                            message="✅ Back to breakeven from drawdown!",
+                            value=to_decimal(recovery),
+                            threshold=to_decimal(drawdown_depth),
+                            symbol=None,
+                            timestamp=now,
+                        ))
                 else:
-                    await self._send_alert(PnLAlert(
-                        alert_type=AlertType.RECOVERY_MILESTONE,
-                        priority=AlertPriority.LOW,
-                        message=f"↗️ Recovery: {milestone:.0%} of drawdown recovered",
-                        value=recovery,
-                        threshold=Decimal(str(milestone)),
-                        symbol=None,
-                    ))
+                    if self._can_send_alert(AlertType.RECOVERY_MILESTONE, None, now):
+                        await self._send_alert(PnLAlert(
+                            alert_type=AlertType.RECOVERY_MILESTONE,
+                            priority=AlertPriority.LOW,
+                            message=f"↗️ Recovery: {milestone:.0%} of drawdown recovered",
+                            value=to_decimal(recovery),
+                            threshold=self._d_recovery_milestones[milestone],
+                            symbol=None,
+                            timestamp=now,
+                        ))
     
     def get_portfolio_pnl(self) -> PortfolioPnL:
         """Get current portfolio P&L summary."""
         total_trades = self._winning_trades + self._losing_trades
         win_rate = self._winning_trades / total_trades if total_trades > 0 else 0.0
         
-        # Calculate total unrealized
-        total_unrealized = sum(
-            pos.unrealized_pnl for pos in self._position_pnl.values()
-        )
+        total_unrealized = self._total_unrealized
         
         # Calculate drawdown
         drawdown = self._peak_equity - self._current_equity
-        drawdown_pct = float(drawdown / self._peak_equity) if self._peak_equity > 0 else 0.0
-        
-        # Calculate velocity
-        pnl_velocity = Decimal("0")
-        if len(self._pnl_history) >= 2:
-            time_diff = (self._pnl_history[-1]["timestamp"] - self._pnl_history[0]["timestamp"]).total_seconds() / 60
-            if time_diff > 0:
-                equity_diff = self._pnl_history[-1]["equity"] - self._pnl_history[0]["equity"]
-                pnl_velocity = equity_diff / Decimal(str(time_diff))
+        drawdown_pct = drawdown / self._peak_equity if self._peak_equity > 0 else 0.0
+        
+        # Calculate velocity over the same window as the velocity alerts,
+        # ending at the newest sample
+        pnl_velocity = _ZERO
+        if self._hist_count >= 2:
+            newest_ts = self._hist_ts[(self._hist_head - 1) % self._hist_cap]
+            window = self._velocity_window(
+                newest_ts - self.config.velocity_window_minutes * 60
+            )
+            if window is not None:
+                start, end = window
+                time_diff = (self._hist_ts[end] - self._hist_ts[start]) / 60
+                if time_diff > 0:
+                    equity_diff = self._hist_equity[end] - self._hist_equity[start]
+                    pnl_velocity = to_decimal(round(equity_diff / time_diff))
         
         daily_total = self._current_equity - self._daily_start_equity
+        total_unrealized_d = to_decimal(total_unrealized)
         
         return PortfolioPnL(
-            total_unrealized_pnl=total_unrealized,
-            total_realized_pnl=self._total_realized_pnl,
-            total_pnl=total_unrealized + self._total_realized_pnl,
-            daily_realized_pnl=self._daily_realized_pnl,
-            daily_unrealized_pnl=total_unrealized,
-            daily_total_pnl=daily_total,
-            peak_equity=self._peak_equity,
-            current_equity=self._current_equity,
-            drawdown=drawdown,
+            total_unrealized_pnl=total_unrealized_d,
+            total_realized_pnl=to_decimal(self._total_realized_pnl),
+            total_pnl=to_decimal(total_unrealized + self._total_realized_pnl),
+            daily_realized_pnl=to_decimal(self._daily_realized_pnl),
+            daily_unrealized_pnl=total_unrealized_d,
+            daily_total_pnl=to_decimal(daily_total),
+            peak_equity=to_decimal(self._peak_equity),
+            current_equity=to_decimal(self._current_equity),
+            drawdown=to_decimal(drawdown),
             drawdown_pct=drawdown_pct,
             winning_trades=self._winning_trades,
             losing_trades=self._losing_trades,
@@ -666,15 +883,28 @@ class PnLTracker:
         """Get P&L for a specific position."""
         return self._position_pnl.get(symbol)
     
-    def get_all_position_pnl(self) -> Dict[str, PositionPnL]:
-        """Get P&L for all positions."""
-        return self._position_pnl.copy()
+    def get_all_position_pnl(self) -> Mapping[str, PositionPnL]:
+        """
+        Get P&L for all positions.
+        
+        Returns a live read-only view; wrap in dict() for a snapshot.
+        """
+        return MappingProxyType(self._position_pnl)
     
     def get_alerts(self, unacknowledged_only: bool = True) -> List[PnLAlert]:
-        """Get pending alerts."""
+        """Get pending alerts (the most recent _MAX_PENDING_ALERTS are kept)."""
         if unacknowledged_only:
             return [a for a in self._pending_alerts if not a.acknowledged]
-        return self._pending_alerts.copy()
+        return list(self._pending_alerts)
+    
+    def get_unacknowledged_count(self) -> int:
+        """
+        Number of pending alerts not yet acknowledged.
+        
+        Counted from the alerts themselves, since callers may acknowledge
+        an alert returned by get_alerts() directly.
+        """
+        return sum(not a.acknowledged for a in self._pending_alerts)
     
     def acknowledge_alert(self, index: int):
         """Acknowledge an alert by index."""
@@ -688,7 +918,10 @@ class PnLTracker:
     
     def clear_acknowledged_alerts(self):
         """Remove all acknowledged alerts."""
-        self._pending_alerts = [a for a in self._pending_alerts if not a.acknowledged]
+        self._pending_alerts = deque(
+            (a for a in self._pending_alerts if not a.acknowledged),
+            maxlen=_MAX_PENDING_ALERTS,
+        )
     
     def record_trade(self, realized_pnl: Decimal):
         """
@@ -696,42 +929,46 @@ class PnLTracker:
         
         Call this when a position is closed.
         """
-        self._total_realized_pnl += realized_pnl
-        self._daily_realized_pnl += realized_pnl
+        self._apply_realized(to_units(realized_pnl))
+    
+    def _apply_realized(self, realized_u: int):
+        """Add realized P&L (in units) to the totals and update win/loss streaks."""
+        self._total_realized_pnl += realized_u
+        self._daily_realized_pnl += realized_u
         
-        if realized_pnl > 0:
+        if realized_u > 0:
             self._winning_trades += 1
-            if self._current_streak >= 0:
-                self._current_streak += 1
-            else:
-                self._current_streak = 1
-            self._best_winning_streak = max(self._best_winning_streak, self._current_streak)
-        elif realized_pnl < 0:
+            streak = self._current_streak + 1 if self._current_streak > 0 else 1
+            self._current_streak = streak
+            if streak > self._best_winning_streak:
+                self._best_winning_streak = streak
+        elif realized_u < 0:
             self._losing_trades += 1
-            if self._current_streak <= 0:
-                self._current_streak -= 1
-            else:
-                self._current_streak = -1
-            self._worst_losing_streak = min(self._worst_losing_streak, self._current_streak)
+            streak = self._current_streak - 1 if self._current_streak < 0 else -1
+            self._current_streak = streak
+            if streak < self._worst_losing_streak:
+                self._worst_losing_streak = streak
     
     def reset_daily(self):
         """Force reset of daily tracking."""
-        self._daily_realized_pnl = Decimal("0")
+        self._daily_realized_pnl = 0
         self._daily_start_equity = self._current_equity
-        self._daily_reset = datetime.now().replace(hour=0, minute=0, second=0)
+        self._set_daily_reset(datetime.now())
         self._recovery_alerts_sent.clear()
     
     def set_initial_equity(self, equity: Decimal):
         """Set initial equity (for startup)."""
-        self._current_equity = equity
-        self._peak_equity = equity
-        self._daily_start_equity = equity
+        equity_u = to_units(equity)
+        self._current_equity = equity_u
+        self._peak_equity = equity_u
+        self._daily_start_equity = equity_u
 
 
 # Factory function for small accounts
 def create_small_account_tracker(
     initial_equity: Decimal,
     on_alert: Optional[Callable[[PnLAlert], Awaitable[None]]] = None,
+    on_alert_batch: Optional[Callable[[List[PnLAlert]], Awaitable[None]]] = None,
 ) -> PnLTracker:
     """
     Create a P&L tracker configured for small accounts.
@@ -770,4 +1007,5 @@ def create_small_account_tracker(
         config=config,
         initial_equity=initial_equity,
         on_alert=on_alert,
+        on_alert_batch=on_alert_batch,
     )
@@ -10,13 +10,27 @@ Implements:
 
 import logging
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Optional, Dict, List, Tuple
+from functools import lru_cache
+from typing import Optional, Dict, List, Tuple, Iterable, Sequence
 from enum import Enum
 
+from .fixed_point import to_units, to_decimal
+
 logger = logging.getLogger(__name__)
 
+# Attributes that feed the precomputed fixed-point sizing limits
+_SIZING_LIMIT_FIELDS = frozenset({"account_equity", "max_position_pct", "max_total_risk_pct"})
+
+# Max correlated exposure as a fraction of equity
+_MAX_CORRELATED_PCT = 0.20
+
+# Target annual volatility contribution (10%) folded with the half-Kelly factor
+_HALF_TARGET_VOL = 0.05
+
+_ZERO = Decimal("0")
+
 
 class SizingMethod(Enum):
     KELLY = "kelly"
@@ -26,7 +40,34 @@ class SizingMethod(Enum):
     VOLATILITY_ADJUSTED = "volatility_adjusted"
 
 
-@dataclass
+# Kelly multiplier per sizing method; methods not listed have their own rule
+_METHOD_SCALE: Dict[SizingMethod, float] = {
+    SizingMethod.KELLY: 1.0,
+    SizingMethod.HALF_KELLY: 0.5,
+    SizingMethod.QUARTER_KELLY: 0.25,
+}
+
+
+@lru_cache(maxsize=1024)
+def _kelly_from_pair(p: float, b: float) -> Tuple[float, Tuple[str, ...]]:
+    """Kelly fraction and warnings for win rate p and win/loss ratio b (memoized)."""
+    if b == 0:
+        return 0.0, ("Win/loss ratio is zero",)
+    
+    kelly = (p * b - (1 - p)) / b
+    
+    # Check for negative expectancy
+    if kelly <= 0:
+        return 0.0, (f"Negative expectancy: Kelly = {kelly:.4f}",)
+    
+    # Warn if Kelly suggests very aggressive sizing
+    if kelly > 0.5:
+        return kelly, (f"Kelly suggests aggressive sizing: {kelly:.1%}",)
+    
+    return kelly, ()
+
+
+@dataclass(slots=True)
 class TradeStats:
     """Historical trade statistics for Kelly calculation."""
     win_rate: float  # Probability of winning (0-1)
@@ -46,7 +87,7 @@ class TradeStats:
         return (self.win_rate * float(self.avg_win)) - ((1 - self.win_rate) * float(self.avg_loss))
 
 
-@dataclass
+@dataclass(slots=True)
 class PositionSizeResult:
     """Result of position sizing calculation."""
     shares: int
@@ -56,12 +97,19 @@ class PositionSizeResult:
     method_used: SizingMethod
     confidence: float  # 0-1, how confident we are in this sizing
     warnings: List[str]
+    # Decimal amounts formatted once at construction for to_dict()
+    notional_value_str: str = field(init=False, repr=False, compare=False)
+    risk_amount_str: str = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.notional_value_str = str(self.notional_value)
+        self.risk_amount_str = str(self.risk_amount)
     
     def to_dict(self) -> Dict:
         return {
             "shares": self.shares,
-            "notional_value": str(self.notional_value),
-            "risk_amount": str(self.risk_amount),
+            "notional_value": self.notional_value_str,
+            "risk_amount": self.risk_amount_str,
             "kelly_fraction": self.kelly_fraction,
             "method_used": self.method_used.value,
             "confidence": self.confidence,
@@ -93,15 +141,37 @@ class PositionSizer:
         max_total_risk_pct: float = 0.02,  # Max 2% account risk per trade
         default_method: SizingMethod = SizingMethod.HALF_KELLY,
         min_sample_trades: int = 30,  # Minimum trades needed for reliable stats
+        emit_warnings: bool = True,  # Format detailed warning messages
     ):
         self.account_equity = account_equity
         self.max_position_pct = max_position_pct
         self.max_total_risk_pct = max_total_risk_pct
         self.default_method = default_method
         self.min_sample_trades = min_sample_trades
+        self.emit_warnings = emit_warnings
         
         # Cache for volatility data
         self._volatility_cache: Dict[str, float] = {}
+        
+        # symbol -> (snapshot of its correlation row, |correlation| row)
+        self._corr_rows: Dict[str, Tuple[Dict[str, float], Dict[str, float]]] = {}
+    
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        if name in _SIZING_LIMIT_FIELDS:
+            self._refresh_limits()
+    
+    def _refresh_limits(self):
+        """Recompute fixed-point equity and cap amounts after a limit change."""
+        attrs = self.__dict__
+        if not _SIZING_LIMIT_FIELDS.issubset(attrs):
+            return  # Still initializing
+        equity_u = to_units(attrs["account_equity"])
+        attrs["_equity_u"] = equity_u
+        attrs["_max_risk_u"] = round(equity_u * attrs["max_total_risk_pct"])
+        attrs["_max_position_value_u"] = round(equity_u * attrs["max_position_pct"])
+        attrs["_max_correlated_u"] = round(equity_u * _MAX_CORRELATED_PCT)
+        attrs["_equity_cap_u"] = equity_u * 9 // 10
     
     def calculate_kelly_fraction(self, stats: TradeStats) -> Tuple[float, List[str]]:
         """
@@ -110,38 +180,16 @@ class PositionSizer:
         Returns:
             Tuple of (kelly_fraction, warnings)
         """
-        warnings = []
-        
         # Validate inputs
         if stats.win_rate <= 0 or stats.win_rate >= 1:
-            warnings.append(f"Invalid win rate: {stats.win_rate}")
-            return 0.0, warnings
+            return 0.0, [f"Invalid win rate: {stats.win_rate}"]
         
         if stats.avg_loss <= 0:
-            warnings.append("Cannot calculate Kelly with zero avg_loss")
-            return 0.0, warnings
-        
-        # Calculate Kelly fraction
-        p = stats.win_rate
-        q = 1 - p
-        b = stats.win_loss_ratio
-        
-        if b == 0:
-            warnings.append("Win/loss ratio is zero")
-            return 0.0, warnings
-        
-        kelly = (p * b - q) / b
-        
-        # Check for negative expectancy
-        if kelly <= 0:
-            warnings.append(f"Negative expectancy: Kelly = {kelly:.4f}")
-            return 0.0, warnings
+            return 0.0, ["Cannot calculate Kelly with zero avg_loss"]
         
-        # Warn if Kelly suggests very aggressive sizing
-        if kelly > 0.5:
-            warnings.append(f"Kelly suggests aggressive sizing: {kelly:.1%}")
-        
-        return kelly, warnings
+        # Formula is pure in (p, b); repeated stats hit the cache
+        kelly, warnings = _kelly_from_pair(stats.win_rate, stats.win_loss_ratio)
+        return kelly, list(warnings)
     
     def calculate_position_size(
         self,
@@ -172,19 +220,21 @@ class PositionSizer:
         method = method or self.default_method
         confidence = 1.0
         
+        # Work in fixed-point units; Decimal only at the result boundary
+        entry_u = to_units(entry_price)
+        equity_u = self._equity_u
+        
         # Calculate per-share risk if stop loss provided
         if stop_loss_price:
-            risk_per_share = abs(entry_price - stop_loss_price)
+            risk_per_share_u = abs(entry_u - to_units(stop_loss_price))
         else:
             # Estimate risk as 2% of entry price
-            risk_per_share = entry_price * Decimal("0.02")
+            risk_per_share_u = round(entry_u * 0.02)
             warnings.append("No stop loss provided, estimating 2% risk")
         
-        # Calculate max position based on account risk limit
-        max_risk_amount = self.account_equity * Decimal(str(self.max_total_risk_pct))
-        
-        # Calculate max position based on position size limit
-        max_position_value = self.account_equity * Decimal(str(self.max_position_pct))
+        # Max risk amount and max position value (precomputed from equity)
+        max_risk_u = self._max_risk_u
+        max_position_value_u = self._max_position_value_u
         
         # Calculate Kelly-based sizing
         kelly_fraction = 0.0
@@ -196,30 +246,43 @@ class PositionSizer:
             # Reduce confidence if insufficient data
             if num_trades < self.min_sample_trades:
                 confidence *= (num_trades / self.min_sample_trades)
-                warnings.append(f"Low sample size: {num_trades} trades")
+                if self.emit_warnings:
+                    warnings.append(f"Low sample size: {num_trades} trades")
         else:
             # Default conservative Kelly estimate
             kelly_fraction = 0.05  # 5% default
             confidence *= 0.5
             warnings.append("No trade stats provided, using conservative default")
         
+        # No edge: skip the sizing math unless the method ignores Kelly
+        if kelly_fraction <= 0.0 and method is not SizingMethod.FIXED_FRACTIONAL:
+            warnings.append("No positive edge, not sizing a position")
+            return PositionSizeResult(
+                0,
+                _ZERO,
+                _ZERO,
+                kelly_fraction,
+                method,
+                confidence,
+                warnings,
+            )
+        
         # Apply method-specific adjustment
-        if method == SizingMethod.KELLY:
-            position_fraction = kelly_fraction
-        elif method == SizingMethod.HALF_KELLY:
-            position_fraction = kelly_fraction * 0.5
-        elif method == SizingMethod.QUARTER_KELLY:
-            position_fraction = kelly_fraction * 0.25
-        elif method == SizingMethod.FIXED_FRACTIONAL:
+        scale = _METHOD_SCALE.get(method)
+        if scale is not None:
+            position_fraction = kelly_fraction * scale
+        elif method is SizingMethod.FIXED_FRACTIONAL:
             # Fixed 1% risk per trade
             position_fraction = 0.01
-        elif method == SizingMethod.VOLATILITY_ADJUSTED:
+        elif method is SizingMethod.VOLATILITY_ADJUSTED:
             # Adjust based on volatility
             if volatility:
-                # Target 10% annual volatility contribution
-                target_vol = 0.10
-                vol_adjustment = target_vol / volatility if volatility > 0 else 0.5
-                position_fraction = kelly_fraction * 0.5 * min(vol_adjustment, 2.0)
+                # Half Kelly scaled toward 10% annual volatility, capped at 2x:
+                # 0.5 * min(0.10 / vol, 2.0) == min(0.05 / vol, 1.0)
+                if volatility > 0:
+                    position_fraction = kelly_fraction * min(_HALF_TARGET_VOL / volatility, 1.0)
+                else:
+                    position_fraction = kelly_fraction * 0.25
             else:
                 position_fraction = kelly_fraction * 0.5
                 warnings.append("No volatility provided for vol-adjusted sizing")
@@ -227,46 +290,101 @@ class PositionSizer:
             position_fraction = kelly_fraction * 0.5
         
         # Calculate position value
-        position_value = self.account_equity * Decimal(str(position_fraction))
+        position_value_u = round(equity_u * position_fraction)
         
         # Apply caps
-        if position_value > max_position_value:
-            position_value = max_position_value
-            warnings.append(f"Position capped at {self.max_position_pct:.0%} of account")
+        if position_value_u > max_position_value_u:
+            position_value_u = max_position_value_u
+            if self.emit_warnings:
+                warnings.append(f"Position capped at {self.max_position_pct:.0%} of account")
         
         # Calculate risk-adjusted position if stop loss provided
-        if risk_per_share > 0:
-            max_shares_by_risk = int(max_risk_amount / risk_per_share)
-            max_shares_by_position = int(position_value / entry_price)
-            shares = min(max_shares_by_risk, max_shares_by_position)
-            
-            if shares < max_shares_by_position:
+        shares = position_value_u // entry_u
+        if risk_per_share_u > 0:
+            max_shares_by_risk = max_risk_u // risk_per_share_u
+            if max_shares_by_risk < shares:
+                shares = max_shares_by_risk
                 warnings.append("Position limited by risk tolerance")
-        else:
-            shares = int(position_value / entry_price)
         
         # Ensure at least 1 share
-        shares = max(1, shares)
+        if shares < 1:
+            shares = 1
         
-        # Calculate final values
-        notional_value = entry_price * shares
-        risk_amount = risk_per_share * shares
-        
-        # Final sanity checks
-        if notional_value > self.account_equity:
-            shares = int(self.account_equity * Decimal("0.9") / entry_price)
-            notional_value = entry_price * shares
-            risk_amount = risk_per_share * shares
+        # Final sanity check: never exceed equity (fall back to 90% of it)
+        if entry_u * shares > equity_u:
+            shares = self._equity_cap_u // entry_u
             warnings.append("Position exceeds account equity, reduced")
         
+        # Calculate final values
+        notional_u = entry_u * shares
+        
+        # Positional construction: skips keyword dispatch on the hot path
         return PositionSizeResult(
-            shares=shares,
-            notional_value=notional_value,
-            risk_amount=risk_amount,
-            kelly_fraction=kelly_fraction,
-            method_used=method,
-            confidence=confidence,
-            warnings=warnings,
+            shares,
+            to_decimal(notional_u),
+            to_decimal(risk_per_share_u * shares),
+            kelly_fraction,
+            method,
+            confidence,
+            warnings,
+        )
+    
+    def _abs_correlation_row(
+        self,
+        correlation_matrix: Dict[str, Dict[str, float]],
+        symbol: str,
+    ) -> Dict[str, float]:
+        """
+        Get symbol's non-zero absolute correlations.
+        
+        The cached row is reused only while the matrix's row for symbol
+        still equals the snapshot it was built from, so in-place edits
+        and new matrices are both picked up.
+        """
+        source = correlation_matrix.get(symbol, {})
+        cached = self._corr_rows.get(symbol)
+        # Dict equality runs in C; rebuilding the row does not
+        if cached is not None and cached[0] == source:
+            return cached[1]
+        
+        row = {other: abs(corr) for other, corr in source.items() if corr}
+        self._corr_rows[symbol] = (dict(source), row)
+        return row
+    
+    @staticmethod
+    def _correlated_exposure_u(row: Dict[str, float], existing_u: Dict[str, int]) -> int:
+        """Sum existing position values (in units) weighted by their |correlation| row entry."""
+        # Key-view intersection walks the smaller side, so only matches cost anything
+        return sum(round(existing_u[sym] * row[sym]) for sym in row.keys() & existing_u.keys())
+    
+    def _adjust_for_correlation(
+        self,
+        result: PositionSizeResult,
+        entry_price: Decimal,
+        total_correlated_u: int,
+    ) -> PositionSizeResult:
+        """Reduce a sized position if highly correlated exposure exists."""
+        max_correlated_u = self._max_correlated_u
+        if total_correlated_u <= max_correlated_u or not result.shares:
+            return result
+        
+        reduction_factor = max_correlated_u / (
+            total_correlated_u + to_units(result.notional_value)
+        )
+        new_shares = max(1, int(result.shares * reduction_factor))
+        
+        if self.emit_warnings:
+            result.warnings.append(
+                f"Position reduced due to correlated exposure: {new_shares} shares"
+            )
+        return PositionSizeResult(
+            new_shares,
+            entry_price * new_shares,
+            to_decimal(round(to_units(result.risk_amount) * reduction_factor)),
+            result.kelly_fraction,
+            result.method_used,
+            result.confidence * reduction_factor,
+            result.warnings,
         )
     
     def calculate_portfolio_position_size(
@@ -293,36 +411,64 @@ class PositionSizer:
         
         # Adjust for portfolio correlation
         if correlation_matrix and existing_positions:
-            total_correlated_exposure = Decimal("0")
-            
-            for existing_symbol, existing_value in existing_positions.items():
-                if existing_symbol in correlation_matrix.get(symbol, {}):
-                    correlation = correlation_matrix[symbol][existing_symbol]
-                    # Add correlated portion
-                    total_correlated_exposure += existing_value * Decimal(str(abs(correlation)))
-            
-            # Reduce position if highly correlated exposure exists
-            max_correlated = self.account_equity * Decimal("0.20")  # 20% max correlated exposure
-            
-            if total_correlated_exposure > max_correlated:
-                reduction_factor = float(max_correlated / (total_correlated_exposure + result.notional_value))
-                new_shares = max(1, int(result.shares * reduction_factor))
-                
-                result.warnings.append(
-                    f"Position reduced due to correlated exposure: {new_shares} shares"
-                )
-                result = PositionSizeResult(
-                    shares=new_shares,
-                    notional_value=entry_price * new_shares,
-                    risk_amount=result.risk_amount * Decimal(str(reduction_factor)),
-                    kelly_fraction=result.kelly_fraction,
-                    method_used=result.method_used,
-                    confidence=result.confidence * reduction_factor,
-                    warnings=result.warnings,
+            row = self._abs_correlation_row(correlation_matrix, symbol)
+            # Only correlated positions need converting to fixed-point
+            existing_u = {
+                sym: to_units(existing_positions[sym])
+                for sym in row.keys() & existing_positions.keys()
+            }
+            # Symbols with no correlated positions (e.g. new tickers) skip the adjustment
+            if existing_u:
+                result = self._adjust_for_correlation(
+                    result,
+                    entry_price,
+                    self._correlated_exposure_u(row, existing_u),
                 )
         
         return result
     
+    def calculate_portfolio_position_size_batch(
+        self,
+        candidates: Dict[str, Decimal],  # symbol -> entry_price
+        existing_positions: Dict[str, Decimal],  # symbol -> market_value
+        correlation_matrix: Optional[Dict[str, Dict[str, float]]] = None,
+        stats: Optional[TradeStats] = None,
+        method: Optional[SizingMethod] = None,
+    ) -> Dict[str, PositionSizeResult]:
+        """
+        Size several candidate symbols against the same portfolio.
+        
+        Equivalent to calling calculate_portfolio_position_size per
+        candidate, but existing positions are converted to fixed-point
+        once for the whole batch.
+        
+        Returns:
+            Dict of symbol -> PositionSizeResult
+        """
+        adjust = bool(correlation_matrix and existing_positions)
+        if adjust:
+            existing_u = {sym: to_units(value) for sym, value in existing_positions.items()}
+        
+        results: Dict[str, PositionSizeResult] = {}
+        for symbol, entry_price in candidates.items():
+            result = self.calculate_position_size(
+                symbol=symbol,
+                entry_price=entry_price,
+                stats=stats,
+                method=method,
+            )
+            if adjust:
+                row = self._abs_correlation_row(correlation_matrix, symbol)
+                if row:
+                    result = self._adjust_for_correlation(
+                        result,
+                        entry_price,
+                        self._correlated_exposure_u(row, existing_u),
+                    )
+            results[symbol] = result
+        
+        return results
+    
     def update_account_equity(self, equity: Decimal):
         """Update account equity for position sizing calculations."""
         self.account_equity = equity
@@ -351,13 +497,14 @@ def calculate_kelly_from_trades(
     
     win_rate = len(winning_trades) / total_trades
     
+    # sum/map reduce in C without a generator frame per trade
     avg_win = (
         sum(winning_trades) / len(winning_trades)
         if winning_trades else Decimal("0")
     )
     
     avg_loss = (
-        sum(abs(l) for l in losing_trades) / len(losing_trades)
+        sum(map(abs, losing_trades)) / len(losing_trades)
         if losing_trades else Decimal("0")
     )
     
@@ -368,6 +515,93 @@ def calculate_kelly_from_trades(
     )
 
 
+def calculate_kelly_from_returns(returns: Iterable[Decimal]) -> TradeStats:
+    """
+    Calculate TradeStats from signed per-trade returns.
+    
+    Positive returns count as wins and negative returns as losses;
+    breakeven trades are ignored.
+    """
+    returns = list(returns)
+    winning_trades = [r for r in returns if r > 0]
+    losing_trades = [r for r in returns if r < 0]
+    return calculate_kelly_from_trades(winning_trades, losing_trades)
+
+
+@lru_cache(maxsize=32)
+def _cholesky(cov: Tuple[Tuple[float, ...], ...]) -> Tuple[Tuple[float, ...], ...]:
+    """Lower-triangular Cholesky factor of a covariance matrix (memoized)."""
+    n = len(cov)
+    factor: List[List[float]] = [[0.0] * n for _ in range(n)]
+    for i in range(n):
+        row_i = factor[i]
+        for j in range(i + 1):
+            row_j = factor[j]
+            total = cov[i][j] - sum(row_i[k] * row_j[k] for k in range(j))
+            if i == j:
+                if total <= 0:
+                    raise ValueError("Covariance matrix is not positive definite")
+                row_i[j] = math.sqrt(total)
+            else:
+                row_i[j] = total / row_j[j]
+    return tuple(map(tuple, factor))
+
+
+def multi_asset_kelly(
+    mu: Sequence[float],
+    cov: Sequence[Sequence[float]],
+    risk_free: float = 0.0,
+    fraction: float = 0.5,
+    max_leverage: float = 1.0,
+) -> List[float]:
+    """
+    Calculate multi-asset Kelly allocations f* = fraction * Σ⁻¹(μ - r).
+    
+    Solves the covariance system by Cholesky factorization; the factor is
+    cached, so repeated calls with the same covariance only do the two
+    triangular solves. Negative allocations are clipped to zero (long
+    only), then the vector is scaled down if its sum would exceed
+    max_leverage.
+    
+    Args:
+        mu: Expected excess-return vector (one entry per asset)
+        cov: Covariance matrix of asset returns
+        risk_free: Risk-free rate subtracted from mu
+        fraction: Kelly multiplier (0.5 = half Kelly)
+        max_leverage: Upper bound on gross allocation (sum of weights)
+    
+    Returns:
+        List of allocations as fractions of equity, in mu's order
+    """
+    n = len(mu)
+    if len(cov) != n or any(len(row) != n for row in cov):
+        raise ValueError("Covariance matrix must be square and match mu")
+    if n == 0:
+        return []
+    
+    factor = _cholesky(tuple(map(tuple, cov)))
+    
+    # Forward substitution: L y = mu - r
+    y = [0.0] * n
+    for i in range(n):
+        row = factor[i]
+        y[i] = (mu[i] - risk_free - sum(row[k] * y[k] for k in range(i))) / row[i]
+    
+    # Back substitution: L^T x = y
+    x = [0.0] * n
+    for i in range(n - 1, -1, -1):
+        x[i] = (y[i] - sum(factor[k][i] * x[k] for k in range(i + 1, n))) / factor[i][i]
+    
+    weights = [max(w * fraction, 0.0) for w in x]
+    
+    # Cap gross leverage, keeping the relative allocation
+    gross = sum(weights)
+    if gross > max_leverage:
+        scale = max_leverage / gross
+        weights = [w * scale for w in weights]
+    return weights
+
+
 def optimal_f_from_trades(trade_returns: List[float]) -> float:
     """
     Calculate optimal f using the secure f formula.
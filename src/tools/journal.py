@@ -17,8 +17,16 @@ from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
 from pathlib import Path
-from typing import Optional, Dict, List, Any, Union
+from typing import Optional, Dict, List, Any, Union, TextIO
+import heapq
 import uuid
+from collections import Counter, deque
+from operator import attrgetter
+
+try:
+    import orjson  # Optional speedup (see requirements.txt)
+except ImportError:
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -64,7 +72,14 @@ class JournalEventType(Enum):
     CUSTOM = "custom"
 
 
-@dataclass
+# Event-type groups counted by get_daily_summary
+_RISK_EVENT_TYPES = frozenset(t for t in JournalEventType if "risk" in t.value)
+_KILL_SWITCH_EVENT_TYPES = frozenset(t for t in JournalEventType if "kill_switch" in t.value)
+
+_BY_TIMESTAMP = attrgetter("timestamp")
+
+
+@dataclass(slots=True)
 class JournalEntry:
     """A single journal entry."""
     event_id: str
@@ -127,6 +142,28 @@ class DecimalEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+# Shared encoder for journal lines (json.dumps(cls=...) builds one per call)
+_LINE_ENCODER = DecimalEncoder()
+
+
+def _encode_line(obj: Any) -> str:
+    """
+    Serialize a journal line, with orjson when it is installed.
+    
+    Values orjson rejects (e.g. ints wider than 64 bits) fall back to
+    the stdlib encoder so the entry is still written. orjson omits the
+    whitespace json.dumps puts after separators; readers parse either.
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(
+                obj, default=_LINE_ENCODER.default, option=orjson.OPT_NON_STR_KEYS
+            ).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return _LINE_ENCODER.encode(obj)
+
+
 class JournalTool:
     """
     Agent tool for audit trail and decision logging.
@@ -168,8 +205,15 @@ class JournalTool:
         self.persist_to_file = persist_to_file
         self.max_memory_entries = max_memory_entries
         
-        # In-memory buffer
-        self._entries: List[JournalEntry] = []
+        # In-memory buffer (oldest entries drop off once full)
+        self._entries: deque = deque(maxlen=max_memory_entries)
+        
+        # client_order_id -> buffered entries, oldest first
+        self._by_client_order_id: Dict[str, deque] = {}
+        
+        # Append handle for the current day's file (opened on first write)
+        self._file: Optional[TextIO] = None
+        self._file_date: Optional[str] = None
         
         # Ensure directory exists
         if persist_to_file:
@@ -201,10 +245,13 @@ class JournalTool:
             error=error,
         )
         
-        # Add to memory
+        # Add to memory, unindexing the entry the buffer is about to drop
+        if self._entries and len(self._entries) == self._entries.maxlen:
+            self._unindex_entry(self._entries[0])
         self._entries.append(entry)
-        if len(self._entries) > self.max_memory_entries:
-            self._entries = self._entries[-self.max_memory_entries:]
+        # A zero-size buffer keeps nothing, so there is nothing to index
+        if client_order_id and self._entries.maxlen != 0:
+            self._by_client_order_id.setdefault(client_order_id, deque()).append(entry)
         
         # Persist
         if self.persist_to_file:
@@ -212,17 +259,35 @@ class JournalTool:
         
         return entry
     
+    def _unindex_entry(self, entry: JournalEntry):
+        """Remove an entry evicted from the buffer from the order index."""
+        history = self._by_client_order_id.get(entry.client_order_id)
+        if history:
+            history.popleft()  # Evictions are oldest-first
+            if not history:
+                del self._by_client_order_id[entry.client_order_id]
+    
     def _write_entry(self, entry: JournalEntry):
-        """Write entry to file."""
+        """Append entry to the day's file, reusing the open handle."""
         date_str = entry.timestamp.strftime("%Y-%m-%d")
-        filepath = self.journal_dir / f"{date_str}.jsonl"
         
         try:
-            with open(filepath, "a") as f:
-                f.write(json.dumps(entry.to_dict(), cls=DecimalEncoder) + "\n")
+            if date_str != self._file_date:
+                self.close()
+                # Line-buffered: each entry reaches the OS as soon as it is written
+                self._file = open(self.journal_dir / f"{date_str}.jsonl", "a", buffering=1)
+                self._file_date = date_str
+            self._file.write(_encode_line(entry.to_dict()) + "\n")
         except Exception as e:
             logger.error(f"Failed to write journal entry: {e}")
     
+    def close(self):
+        """Close the open journal file, if any."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._file_date = None
+    
     # Order logging methods
     async def log_order_attempt(self, order_request) -> JournalEntry:
         """Log an order attempt."""
@@ -481,50 +546,52 @@ class JournalTool:
         Returns:
             List of matching entries
         """
-        entries = self._entries.copy()
+        entries = list(self._entries)
         
         # Also load from file if date specified
         if date and self.persist_to_file:
             filepath = self.journal_dir / f"{date.isoformat()}.jsonl"
             if filepath.exists():
+                # Dedupe on event_id: O(1) per line instead of a list scan
+                seen = {e.event_id for e in entries}
                 with open(filepath, "r") as f:
-                    for line in f:
-                        try:
-                            entry = JournalEntry.from_dict(json.loads(line))
-                            if entry not in entries:
-                                entries.append(entry)
-                        except Exception:
-                            pass
-        
-        # Filter
-        if date:
-            entries = [e for e in entries if e.timestamp.date() == date]
-        if event_type:
-            entries = [e for e in entries if e.event_type == event_type]
-        if symbol:
-            entries = [e for e in entries if e.symbol == symbol]
+                    lines = f.read().splitlines()
+                for line in lines:
+                    try:
+                        entry = JournalEntry.from_dict(json.loads(line))
+                    except Exception:
+                        continue
+                    if entry.event_id not in seen:
+                        seen.add(entry.event_id)
+                        entries.append(entry)
         
-        # Sort by timestamp descending
-        entries.sort(key=lambda e: e.timestamp, reverse=True)
+        # Filter in one pass
+        if date or event_type or symbol:
+            entries = [
+                e for e in entries
+                if (not date or e.timestamp.date() == date)
+                and (not event_type or e.event_type == event_type)
+                and (not symbol or e.symbol == symbol)
+            ]
         
-        return entries[:limit]
+        # Newest first; nlargest avoids sorting everything for a small limit
+        return heapq.nlargest(limit, entries, key=_BY_TIMESTAMP)
     
     def get_order_history(self, client_order_id: str) -> List[JournalEntry]:
         """Get all entries for a specific order."""
-        return [
-            e for e in self._entries
-            if e.client_order_id == client_order_id
-        ]
+        return list(self._by_client_order_id.get(client_order_id, ()))
     
     def get_daily_summary(self, date: Optional[date] = None) -> Dict[str, Any]:
         """Get summary statistics for a day."""
         target_date = date or datetime.now().date()
         entries = self.get_entries(date=target_date, limit=10000)
         
-        orders_attempted = len([e for e in entries if e.event_type == JournalEventType.ORDER_ATTEMPT])
-        orders_submitted = len([e for e in entries if e.event_type == JournalEventType.ORDER_SUBMITTED])
-        orders_filled = len([e for e in entries if e.event_type == JournalEventType.ORDER_FILLED])
-        orders_rejected = len([e for e in entries if e.event_type == JournalEventType.ORDER_REJECTED])
+        # One pass over the entries; every count below reads from this
+        counts = Counter(e.event_type for e in entries)
+        orders_attempted = counts[JournalEventType.ORDER_ATTEMPT]
+        orders_submitted = counts[JournalEventType.ORDER_SUBMITTED]
+        orders_filled = counts[JournalEventType.ORDER_FILLED]
+        orders_rejected = counts[JournalEventType.ORDER_REJECTED]
         
         return {
             "date": target_date.isoformat(),
@@ -535,8 +602,8 @@ class JournalTool:
             "orders_rejected": orders_rejected,
             "fill_rate": orders_filled / orders_submitted if orders_submitted > 0 else 0,
             "rejection_rate": orders_rejected / orders_attempted if orders_attempted > 0 else 0,
-            "risk_events": len([e for e in entries if "risk" in e.event_type.value.lower()]),
-            "kill_switch_events": len([e for e in entries if "kill_switch" in e.event_type.value]),
+            "risk_events": sum(counts[t] for t in _RISK_EVENT_TYPES),
+            "kill_switch_events": sum(counts[t] for t in _KILL_SWITCH_EVENT_TYPES),
         }
     
     # Export methods
@@ -13,6 +13,7 @@ import logging
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import cached_property
 from typing import Optional, Dict, List, Any, Callable, AsyncGenerator
 from enum import Enum
 
@@ -23,9 +24,9 @@ class DataSource(Enum):
     ALPACA = "alpaca"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Quote:
-    """Real-time quote data."""
+    """Real-time quote data (immutable; build a new Quote for a new tick)."""
     symbol: str
     bid_price: Decimal
     bid_size: int
@@ -34,18 +35,20 @@ class Quote:
     timestamp: datetime
     source: DataSource
     
-    @property
+    # Frozen, so derived prices can be computed once and cached
+    @cached_property
     def mid_price(self) -> Decimal:
         return (self.bid_price + self.ask_price) / 2
     
-    @property
+    @cached_property
     def spread(self) -> Decimal:
         return self.ask_price - self.bid_price
     
-    @property
+    @cached_property
     def spread_pct(self) -> Decimal:
-        if self.mid_price > 0:
-            return self.spread / self.mid_price
+        mid = self.mid_price
+        if mid > 0:
+            return self.spread / mid
         return Decimal("0")
 
 
@@ -88,6 +91,24 @@ class Snapshot:
     source: DataSource
 
 
+def _parse_alpaca_bar(symbol: str, b: Dict[str, Any], timeframe: str) -> Bar:
+    """Build a Bar from an Alpaca bar payload, reading each key once."""
+    vw = b.get("vw")
+    return Bar(
+        symbol=symbol,
+        open=Decimal(str(b["o"])),
+        high=Decimal(str(b["h"])),
+        low=Decimal(str(b["l"])),
+        close=Decimal(str(b["c"])),
+        volume=b["v"],
+        timestamp=datetime.fromisoformat(b["t"].replace("Z", "+00:00")),
+        timeframe=timeframe,
+        source=DataSource.ALPACA,
+        vwap=Decimal(str(vw)) if vw else None,
+        trade_count=b.get("n"),
+    )
+
+
 class MarketDataTool:
     """
     Agent tool for accessing market data.
@@ -137,8 +158,8 @@ class MarketDataTool:
             data = await self.alpaca.get_snapshot(symbol)
             
             latest_quote = None
-            if data.get("latestQuote"):
-                q = data["latestQuote"]
+            q = data.get("latestQuote")
+            if q:
                 latest_quote = Quote(
                     symbol=symbol,
                     bid_price=Decimal(str(q["bp"])),
@@ -150,8 +171,8 @@ class MarketDataTool:
                 )
             
             latest_trade = None
-            if data.get("latestTrade"):
-                t = data["latestTrade"]
+            t = data.get("latestTrade")
+            if t:
                 latest_trade = Trade(
                     symbol=symbol,
                     price=Decimal(str(t["p"])),
@@ -161,56 +182,14 @@ class MarketDataTool:
                     conditions=t.get("c"),
                 )
             
-            minute_bar = None
-            if data.get("minuteBar"):
-                b = data["minuteBar"]
-                minute_bar = Bar(
-                    symbol=symbol,
-                    open=Decimal(str(b["o"])),
-                    high=Decimal(str(b["h"])),
-                    low=Decimal(str(b["l"])),
-                    close=Decimal(str(b["c"])),
-                    volume=b["v"],
-                    timestamp=datetime.fromisoformat(b["t"].replace("Z", "+00:00")),
-                    timeframe="1Min",
-                    source=DataSource.ALPACA,
-                    vwap=Decimal(str(b["vw"])) if b.get("vw") else None,
-                    trade_count=b.get("n"),
-                )
+            b = data.get("minuteBar")
+            minute_bar = _parse_alpaca_bar(symbol, b, "1Min") if b else None
             
-            daily_bar = None
-            if data.get("dailyBar"):
-                b = data["dailyBar"]
-                daily_bar = Bar(
-                    symbol=symbol,
-                    open=Decimal(str(b["o"])),
-                    high=Decimal(str(b["h"])),
-                    low=Decimal(str(b["l"])),
-                    close=Decimal(str(b["c"])),
-                    volume=b["v"],
-                    timestamp=datetime.fromisoformat(b["t"].replace("Z", "+00:00")),
-                    timeframe="1Day",
-                    source=DataSource.ALPACA,
-                    vwap=Decimal(str(b["vw"])) if b.get("vw") else None,
-                    trade_count=b.get("n"),
-                )
+            b = data.get("dailyBar")
+            daily_bar = _parse_alpaca_bar(symbol, b, "1Day") if b else None
             
-            prev_daily_bar = None
-            if data.get("prevDailyBar"):
-                b = data["prevDailyBar"]
-                prev_daily_bar = Bar(
-                    symbol=symbol,
-                    open=Decimal(str(b["o"])),
-                    high=Decimal(str(b["h"])),
-                    low=Decimal(str(b["l"])),
-                    close=Decimal(str(b["c"])),
-                    volume=b["v"],
-                    timestamp=datetime.fromisoformat(b["t"].replace("Z", "+00:00")),
-                    timeframe="1Day",
-                    source=DataSource.ALPACA,
-                    vwap=Decimal(str(b["vw"])) if b.get("vw") else None,
-                    trade_count=b.get("n"),
-                )
+            b = data.get("prevDailyBar")
+            prev_daily_bar = _parse_alpaca_bar(symbol, b, "1Day") if b else None
             
             return Snapshot(
                 symbol=symbol,
@@ -285,23 +264,7 @@ class MarketDataTool:
             adjustment=adjustment,
         )
         
-        bars = []
-        for b in data.get("bars", []):
-            bars.append(Bar(
-                symbol=symbol,
-                open=Decimal(str(b["o"])),
-                high=Decimal(str(b["h"])),
-                low=Decimal(str(b["l"])),
-                close=Decimal(str(b["c"])),
-                volume=b["v"],
-                timestamp=datetime.fromisoformat(b["t"].replace("Z", "+00:00")),
-                timeframe=timeframe,
-                source=DataSource.ALPACA,
-                vwap=Decimal(str(b["vw"])) if b.get("vw") else None,
-                trade_count=b.get("n"),
-            ))
-        
-        return bars
+        return [_parse_alpaca_bar(symbol, b, timeframe) for b in data.get("bars") or ()]
     
     # Streaming methods
     async def stream_quotes(
@@ -241,7 +241,7 @@ class OrderTool:
                 risk_order, positions, market_price, account_equity
             )
             
-            if risk_result.action == RiskAction.REJECT:
+            if risk_result.action is RiskAction.REJECT:
                 error = f"Risk check failed: {', '.join(risk_result.checks_failed)}"
                 if self.journal:
                     await self.journal.log_order_rejected(request, error)
@@ -252,7 +252,7 @@ class OrderTool:
                     risk_result=risk_result,
                 )
             
-            if risk_result.action == RiskAction.REQUIRE_APPROVAL:
+            if risk_result.action is RiskAction.REQUIRE_APPROVAL:
                 # TODO: Queue for human approval
                 error = f"Human approval required: {risk_result.approval_reason}"
                 if self.journal:
@@ -264,7 +264,7 @@ class OrderTool:
                     risk_result=risk_result,
                 )
             
-            if risk_result.action == RiskAction.DRY_RUN or dry_run:
+            if risk_result.action is RiskAction.DRY_RUN or dry_run:
                 if self.journal:
                     await self.journal.log_order_dry_run(request, risk_result)
                 return OrderResult(
@@ -252,24 +252,31 @@ class PortfolioTool:
         account = await self.get_account()
         positions = await self.get_positions()
         
-        # Calculate metrics
-        total_unrealized_pnl = sum(p.unrealized_pnl for p in positions)
+        # Calculate P&L, exposure and largest position in a single pass
+        total_unrealized_pnl = Decimal("0")
+        long_exposure = Decimal("0")
+        short_exposure = Decimal("0")
+        largest_value = Decimal("0")
+        for p in positions:
+            total_unrealized_pnl += p.unrealized_pnl
+            value = abs(p.market_value)
+            if p.side == "long":
+                long_exposure += p.market_value
+            elif p.side == "short":
+                short_exposure += value
+            if value > largest_value:
+                largest_value = value
         
         # Get realized P&L from activities (if available)
         total_realized_pnl_today = Decimal("0")
         
-        # Exposure calculations
-        long_exposure = sum(p.market_value for p in positions if p.side == "long")
-        short_exposure = sum(abs(p.market_value) for p in positions if p.side == "short")
         net_exposure = long_exposure - short_exposure
         gross_exposure = long_exposure + short_exposure
         
         # Concentration
         largest_position_pct = Decimal("0")
         if positions and account.equity > 0:
-            largest_position_pct = max(
-                abs(p.market_value) / account.equity for p in positions
-            )
+            largest_position_pct = largest_value / account.equity
         
         return PortfolioSummary(
             account=account,
@@ -215,7 +215,7 @@ class RiskTool:
             checks_passed=result.checks_passed,
             checks_failed=result.checks_failed,
             warnings=result.warnings,
-            approval_required=result.action == RiskAction.REQUIRE_APPROVAL,
+            approval_required=result.action is RiskAction.REQUIRE_APPROVAL,
             approval_reason=result.approval_reason,
             order_notional=notional,
         )
@@ -276,25 +276,7 @@ class RiskTool:
     # Limit configuration
     def get_limits(self) -> Dict[str, Any]:
         """Get current risk limits."""
-        limits = self.risk_engine.limits
-        return {
-            "max_order_notional": str(limits.max_order_notional),
-            "max_order_shares": limits.max_order_shares,
-            "max_position_notional": str(limits.max_position_notional),
-            "max_position_shares": limits.max_position_shares,
-            "max_total_exposure": str(limits.max_total_exposure),
-            "max_concentration_pct": str(limits.max_concentration_pct),
-            "max_daily_loss": str(limits.max_daily_loss),
-            "max_weekly_loss": str(limits.max_weekly_loss),
-            "max_drawdown_pct": str(limits.max_drawdown_pct),
-            "daily_spend_limit": str(limits.daily_spend_limit),
-            "weekly_spend_limit": str(limits.weekly_spend_limit),
-            "monthly_spend_limit": str(limits.monthly_spend_limit),
-            "approval_notional_threshold": str(limits.approval_notional_threshold),
-            "approval_loss_threshold": str(limits.approval_loss_threshold),
-            "allowed_symbols": list(limits.allowed_symbols) if limits.allowed_symbols else None,
-            "blocked_symbols": list(limits.blocked_symbols),
-        }
+        return self.risk_engine.limits.to_dict()
     
     def update_limits(
         self,
@@ -356,11 +338,13 @@ class RiskTool:
         if self.risk_engine.limits.allowed_symbols is None:
             self.risk_engine.limits.allowed_symbols = set()
         self.risk_engine.limits.allowed_symbols.add(symbol)
+        self.risk_engine.limits.invalidate_cache()
     
     def remove_allowed_symbol(self, symbol: str):
         """Remove symbol from allowlist."""
         if self.risk_engine.limits.allowed_symbols:
             self.risk_engine.limits.allowed_symbols.discard(symbol)
+            self.risk_engine.limits.invalidate_cache()
     
     def clear_allowlist(self):
         """Clear symbol allowlist (disables whitelist mode)."""
@@ -369,10 +353,12 @@ class RiskTool:
     def add_blocked_symbol(self, symbol: str):
         """Add symbol to blocklist."""
         self.risk_engine.limits.blocked_symbols.add(symbol)
+        self.risk_engine.limits.invalidate_cache()
     
     def remove_blocked_symbol(self, symbol: str):
         """Remove symbol from blocklist."""
         self.risk_engine.limits.blocked_symbols.discard(symbol)
+        self.risk_engine.limits.invalidate_cache()
     
     # P&L tracking
     def update_equity(self, equity: Decimal, realized_pnl: Decimal = Decimal("0")):
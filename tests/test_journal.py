@@ -0,0 +1,166 @@
+"""
+Tests for Journal Tool
+
+Run with: pytest tests/test_journal.py -v
+"""
+
+import json
+import pytest
+from decimal import Decimal
+from datetime import datetime
+
+from src.tools import journal as journal_module
+from src.tools.journal import JournalTool, JournalEntry, JournalEventType
+
+
+@pytest.fixture
+def journal(tmp_path):
+    """Journal writing to a temporary directory."""
+    tool = JournalTool(journal_dir=str(tmp_path), session_id="test")
+    yield tool
+    tool.close()
+
+
+class TestJournalPersistence:
+    """Test journal file persistence."""
+
+    @pytest.mark.asyncio
+    async def test_entries_appended_to_daily_file(self, journal, tmp_path):
+        await journal.log_note("first", symbol="AAPL")
+        await journal.log_order_filled("o1", "AAPL", 10, Decimal("150.25"), "buy")
+
+        filepath = tmp_path / f"{datetime.now().date().isoformat()}.jsonl"
+        lines = filepath.read_text().splitlines()
+
+        assert len(lines) == 2
+        assert json.loads(lines[0])["data"]["note"] == "first"
+        assert json.loads(lines[1])["data"]["filled_price"] == "150.25"
+
+    def test_entry_round_trip(self):
+        entry = JournalEntry(
+            event_id="e1",
+            timestamp=datetime(2024, 1, 2, 9, 30),
+            event_type=JournalEventType.NOTE,
+            symbol="AAPL",
+            data={"note": "hi"},
+            session_id="test",
+        )
+
+        assert not hasattr(entry, "__dict__")
+        assert JournalEntry.from_dict(entry.to_dict()) == entry
+
+    @pytest.mark.asyncio
+    async def test_close_releases_file(self, journal):
+        await journal.log_note("note")
+        assert journal._file is not None
+
+        journal.close()
+        assert journal._file is None
+
+        # Writing again reopens the day's file
+        await journal.log_note("again")
+        assert len(journal.get_entries(date=datetime.now().date())) == 2
+
+    @pytest.mark.asyncio
+    async def test_entry_orjson_rejects_is_still_written(self, journal, tmp_path, monkeypatch):
+        class _RejectingOrjson:
+            """orjson stand-in that rejects every value, as it does ints over 64 bits."""
+            OPT_NON_STR_KEYS = 0
+
+            class JSONEncodeError(TypeError):
+                pass
+
+            @classmethod
+            def dumps(cls, obj, default=None, option=0):
+                raise cls.JSONEncodeError("Integer exceeds 64-bit range")
+
+        monkeypatch.setattr(journal_module, "orjson", _RejectingOrjson)
+        await journal.log_order_filled("o1", "AAPL", 2**70, Decimal("1"), "buy")
+
+        filepath = tmp_path / f"{datetime.now().date().isoformat()}.jsonl"
+        lines = filepath.read_text().splitlines()
+
+        assert len(lines) == 1
+        assert json.loads(lines[0])["data"]["filled_qty"] == 2**70
+
+
+class TestJournalQueries:
+    """Test journal queries and summaries."""
+
+    @pytest.mark.asyncio
+    async def test_get_entries_merges_file_without_duplicates(self, journal, tmp_path):
+        await journal.log_note("in memory and on disk")
+
+        # A second session's entry exists only on disk
+        other = JournalTool(journal_dir=str(tmp_path), session_id="other")
+        await other.log_note("from another session")
+        other.close()
+
+        entries = journal.get_entries(date=datetime.now().date())
+
+        assert len(entries) == 2
+        assert {e.session_id for e in entries} == {"test", "other"}
+
+    @pytest.mark.asyncio
+    async def test_daily_summary_counts(self, journal):
+        await journal.log_risk_check("AAPL", True, ["size"], [], [])
+        await journal.log_risk_check("AAPL", False, [], ["size"], [])
+        await journal.log_kill_switch("test")
+        await journal.log_order_filled("o1", "AAPL", 10, Decimal("150"), "buy")
+
+        summary = journal.get_daily_summary()
+
+        assert summary["total_entries"] == 4
+        assert summary["orders_filled"] == 1
+        assert summary["risk_events"] == 2
+        assert summary["kill_switch_events"] == 1
+        assert summary["fill_rate"] == 0
+
+    @pytest.mark.asyncio
+    async def test_get_entries_filters_and_limits_newest_first(self, journal):
+        for i in range(5):
+            await journal.log_note(f"note {i}", symbol="AAPL" if i % 2 else "MSFT")
+
+        aapl = journal.get_entries(symbol="AAPL", event_type=JournalEventType.NOTE)
+        newest = journal.get_entries(symbol="AAPL", event_type=JournalEventType.NOTE, limit=1)
+
+        assert len(aapl) == 2
+        assert all(e.symbol == "AAPL" for e in aapl)
+        assert aapl[0].timestamp >= aapl[1].timestamp
+        assert newest == aapl[:1]
+
+    @pytest.mark.asyncio
+    async def test_order_history_follows_buffer_eviction(self, tmp_path):
+        journal = JournalTool(journal_dir=str(tmp_path), persist_to_file=False, max_memory_entries=3)
+
+        await journal.log_order_error(_OrderStub("c1"), "first")
+        await journal.log_order_error(_OrderStub("c2"), "second")
+        await journal.log_order_error(_OrderStub("c1"), "third")
+        assert [e.error for e in journal.get_order_history("c1")] == ["first", "third"]
+
+        # Buffer is full: the oldest c1 entry is evicted from the index too
+        await journal.log_order_error(_OrderStub("c3"), "fourth")
+        assert [e.error for e in journal.get_order_history("c1")] == ["third"]
+
+        await journal.log_order_error(_OrderStub("c3"), "fifth")
+        assert journal.get_order_history("c2") == []
+        assert len(journal.get_entries()) == 3
+
+    @pytest.mark.asyncio
+    async def test_zero_size_buffer_keeps_no_order_index(self, tmp_path):
+        journal = JournalTool(journal_dir=str(tmp_path), persist_to_file=False, max_memory_entries=0)
+
+        for i in range(3):
+            await journal.log_order_error(_OrderStub(f"c{i}"), "error")
+
+        assert journal.get_entries() == []
+        assert journal.get_order_history("c0") == []
+        assert journal._by_client_order_id == {}
+
+
+class _OrderStub:
+    """Minimal order request for journal logging."""
+
+    def __init__(self, client_order_id: str, symbol: str = "AAPL"):
+        self.client_order_id = client_order_id
+        self.symbol = symbol
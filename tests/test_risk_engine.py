@@ -31,6 +31,22 @@ class TestRiskLimits:
         )
         assert limits.max_order_notional == Decimal("5000")
         assert limits.max_daily_loss == Decimal("1000")
+    
+    def test_to_dict_refreshes_after_change(self):
+        limits = RiskLimits()
+        assert limits.to_dict()["max_order_notional"] == "10000"
+        
+        limits.max_order_notional = Decimal("2500")
+        assert limits.to_dict()["max_order_notional"] == "2500"
+    
+    def test_to_dict_lists_are_not_shared(self):
+        limits = RiskLimits(blocked_symbols={"GME"})
+        limits.to_dict()["blocked_symbols"].append("AMC")
+        assert limits.to_dict()["blocked_symbols"] == ["GME"]
+        
+        limits.blocked_symbols.add("GME")
+        limits.invalidate_cache()
+        assert limits.to_dict()["blocked_symbols"] == ["GME"]
 
 
 class TestSpendTracker:
@@ -157,6 +173,8 @@ class TestRiskEngine:
         
         assert result.action == RiskAction.APPROVE
         assert len(result.checks_failed) == 0
+        assert result.checks_passed[:2] == ("symbol_allowlist", "symbol_blocklist")
+        assert "daily_spend_limit" in result.checks_passed
     
     @pytest.mark.asyncio
     async def test_reject_oversized_order(self, engine):
@@ -225,7 +243,20 @@ class TestRiskEngine:
         
         assert result.action == RiskAction.REJECT
         assert any("POSITION_SHARES_EXCEEDED" in f for f in result.checks_failed)
-    
+
+    @pytest.mark.asyncio
+    async def test_concentration_limit(self):
+        engine = RiskEngine(limits=RiskLimits(max_concentration_pct=Decimal("0.25")))
+        order = Order(symbol="AAPL", side="buy", qty=10, order_type="market")
+
+        # 10 * 100 = 1000, exactly 25% of 4000 equity
+        result = await engine.check_order(order, {}, Decimal("100"), Decimal("4000"))
+        assert "concentration" in result.checks_passed
+
+        result = await engine.check_order(order, {}, Decimal("100"), Decimal("3999"))
+        assert result.action == RiskAction.REJECT
+        assert any("CONCENTRATION_EXCEEDED" in f for f in result.checks_failed)
+
     @pytest.mark.asyncio
     async def test_kill_switch_rejects_all(self, engine):
         engine.activate_kill_switch("Test")
@@ -245,6 +276,10 @@ class TestRiskEngine:
         
         assert result.action == RiskAction.REJECT
         assert any("KILL_SWITCH" in f for f in result.checks_failed)
+        assert engine.get_status()["kill_switch_activated_at"] is not None
+        
+        engine.deactivate_kill_switch()
+        assert engine.get_status()["kill_switch_activated_at"] is None
     
     @pytest.mark.asyncio
     async def test_dry_run_mode(self):
@@ -311,6 +346,44 @@ class TestRiskEngine:
         assert result.action == RiskAction.REJECT
         assert any("SYMBOL_BLOCKED" in f for f in result.checks_failed)
     
+    @pytest.mark.asyncio
+    async def test_blocked_symbol_prefix(self):
+        engine = RiskEngine(limits=RiskLimits(blocked_symbol_prefixes=["SPX", "VIX"]))
+        
+        order = Order(symbol="SPXL", side="buy", qty=10, order_type="market")
+        result = await engine.check_order(order, {}, Decimal("50"))
+        assert result.action == RiskAction.REJECT
+        assert any("SYMBOL_BLOCKED" in f for f in result.checks_failed)
+        
+        order = Order(symbol="AAPL", side="buy", qty=10, order_type="market")
+        result = await engine.check_order(order, {}, Decimal("50"))
+        assert result.action == RiskAction.APPROVE
+    
+    @pytest.mark.asyncio
+    async def test_blocked_symbol_pattern(self):
+        limits = RiskLimits()
+        limits.blocked_symbol_patterns = ["*.WS", "SPX??"]
+        engine = RiskEngine(limits=limits)
+        
+        for symbol in ("ABC.WS", "SPXLU"):
+            order = Order(symbol=symbol, side="buy", qty=10, order_type="market")
+            result = await engine.check_order(order, {}, Decimal("50"))
+            assert any("SYMBOL_BLOCKED" in f for f in result.checks_failed)
+        
+        order = Order(symbol="SPXL", side="buy", qty=10, order_type="market")
+        result = await engine.check_order(order, {}, Decimal("50"))
+        assert result.action == RiskAction.APPROVE
+    
+    @pytest.mark.asyncio
+    async def test_blocked_symbol_pattern_from_constructor(self):
+        limits = RiskLimits(blocked_symbol_patterns=("*.WS",))
+        assert RiskLimits()._blocked_symbol_regex is None
+        engine = RiskEngine(limits=limits)
+        
+        order = Order(symbol="ABC.WS", side="buy", qty=10, order_type="market")
+        result = await engine.check_order(order, {}, Decimal("50"))
+        assert any("SYMBOL_BLOCKED" in f for f in result.checks_failed)
+    
     @pytest.mark.asyncio
     async def test_allowed_symbols_whitelist(self):
         limits = RiskLimits(allowed_symbols={"AAPL", "MSFT", "GOOGL"})
@@ -367,6 +440,12 @@ class TestRiskCheckResult:
         )
         assert result.approved is True
 
+    def test_empty_checks_default(self):
+        result = RiskCheckResult(action=RiskAction.REJECT, checks_failed=["test"])
+        assert len(result.checks_passed) == 0
+        assert len(result.warnings) == 0
+        assert not hasattr(result, "__dict__")
+
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
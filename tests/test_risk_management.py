@@ -18,7 +18,8 @@ from unittest.mock import Mock, AsyncMock, patch
 # Import all risk modules
 from src.risk.position_sizing import (
     PositionSizer, SizingMethod, TradeStats, PositionSizeResult,
-    calculate_kelly_from_trades, optimal_f_from_trades
+    calculate_kelly_from_trades, calculate_kelly_from_returns, optimal_f_from_trades,
+    multi_asset_kelly,
 )
 from src.risk.drawdown_protection import (
     DrawdownProtector, DrawdownConfig, DrawdownState, DrawdownLevel,
@@ -32,6 +33,7 @@ from src.risk.pnl_tracker import (
     PnLTracker, AlertConfig, AlertType, AlertPriority, PnLAlert,
     create_small_account_tracker
 )
+from src.risk.fixed_point import to_units
 from src.risk.integrated_risk_manager import (
     IntegratedRiskManager, RiskManagerConfig, TradeDecision,
     create_risk_manager
@@ -103,6 +105,191 @@ class TestPositionSizing:
         assert result.shares <= 2
         assert result.risk_amount <= Decimal("20")
     
+    def test_equity_update_rescales_limits(self):
+        """Position caps follow account equity changes."""
+        sizer = PositionSizer(
+            account_equity=Decimal("1000"),
+            max_position_pct=0.10,
+            max_total_risk_pct=0.50,
+        )
+        stats = TradeStats(win_rate=0.6, avg_win=Decimal("150"), avg_loss=Decimal("100"))
+        
+        result = sizer.calculate_position_size(
+            symbol="AAPL",
+            entry_price=Decimal("10"),
+            stop_loss_price=Decimal("9.50"),
+            stats=stats,
+            method=SizingMethod.KELLY,
+        )
+        assert result.shares == 10  # Capped at $100
+        assert result.notional_value == Decimal("100")
+        assert result.risk_amount == Decimal("5")
+        
+        sizer.update_account_equity(Decimal("2000"))
+        result = sizer.calculate_position_size(
+            symbol="AAPL",
+            entry_price=Decimal("10"),
+            stop_loss_price=Decimal("9.50"),
+            stats=stats,
+            method=SizingMethod.KELLY,
+        )
+        assert result.shares == 20
+    
+    def test_portfolio_size_reduced_by_correlation(self):
+        """Correlated exposure shrinks the position; a new matrix is re-read."""
+        sizer = PositionSizer(account_equity=Decimal("1000"), max_position_pct=0.10)
+        existing = {"MSFT": Decimal("300"), "XOM": Decimal("200")}
+        
+        uncorrelated = sizer.calculate_portfolio_position_size(
+            symbol="AAPL",
+            entry_price=Decimal("10"),
+            existing_positions=existing,
+            correlation_matrix={"AAPL": {"MSFT": 0.1, "XOM": -0.1}},
+        )
+        correlated = sizer.calculate_portfolio_position_size(
+            symbol="AAPL",
+            entry_price=Decimal("10"),
+            existing_positions=existing,
+            correlation_matrix={"AAPL": {"MSFT": 0.9, "XOM": -0.5}},
+        )
+        
+        assert correlated.shares < uncorrelated.shares
+        assert any("correlated" in w for w in correlated.warnings)
+
+    def test_portfolio_size_sees_in_place_correlation_update(self):
+        """Editing the correlation matrix in place is not hidden by the row cache."""
+        sizer = PositionSizer(account_equity=Decimal("1000"), max_position_pct=0.10)
+        existing = {"MSFT": Decimal("300"), "XOM": Decimal("200")}
+        matrix = {"AAPL": {"MSFT": 0.1, "XOM": -0.1}}
+        kwargs = dict(
+            symbol="AAPL",
+            entry_price=Decimal("10"),
+            existing_positions=existing,
+            correlation_matrix=matrix,
+        )
+
+        uncorrelated = sizer.calculate_portfolio_position_size(**kwargs)
+        matrix["AAPL"]["MSFT"] = 0.9
+        matrix["AAPL"]["XOM"] = -0.5
+        correlated = sizer.calculate_portfolio_position_size(**kwargs)
+
+        assert correlated.shares < uncorrelated.shares
+        assert any("correlated" in w for w in correlated.warnings)
+
+    def test_volatility_adjusted_fraction(self):
+        """Vol-adjusted sizing scales half Kelly toward 10% vol, capped at full Kelly."""
+        sizer = PositionSizer(
+            account_equity=Decimal("10000"), max_position_pct=1.0, max_total_risk_pct=1.0,
+        )
+        stats = TradeStats(win_rate=0.6, avg_win=Decimal("150"), avg_loss=Decimal("100"))
+        kwargs = dict(
+            symbol="AAPL",
+            entry_price=Decimal("1"),
+            stop_loss_price=Decimal("0.50"),
+            stats=stats,
+            method=SizingMethod.VOLATILITY_ADJUSTED,
+            num_trades=50,
+        )
+        kelly, _ = sizer.calculate_kelly_fraction(stats)
+
+        high_vol = sizer.calculate_position_size(volatility=0.20, **kwargs)
+        low_vol = sizer.calculate_position_size(volatility=0.01, **kwargs)
+
+        assert high_vol.shares == int(10000 * kelly * 0.25)  # 0.5 * (0.10 / 0.20)
+        assert low_vol.shares == int(10000 * kelly)  # Capped at 2x half Kelly
+
+    def test_portfolio_size_unadjusted_for_unknown_symbol(self):
+        """A symbol missing from the correlation matrix keeps its base size."""
+        sizer = PositionSizer(account_equity=Decimal("1000"), max_position_pct=0.10)
+        existing = {"MSFT": Decimal("300"), "XOM": Decimal("200")}
+
+        base = sizer.calculate_position_size(symbol="NEW", entry_price=Decimal("10"))
+        result = sizer.calculate_portfolio_position_size(
+            symbol="NEW",
+            entry_price=Decimal("10"),
+            existing_positions=existing,
+            correlation_matrix={"AAPL": {"MSFT": 0.9}},
+        )
+
+        assert result.shares == base.shares
+        assert result.warnings == base.warnings
+
+    def test_portfolio_batch_matches_single(self):
+        """Batch sizing gives the same results as per-symbol sizing."""
+        sizer = PositionSizer(account_equity=Decimal("1000"), max_position_pct=0.10)
+        existing = {"MSFT": Decimal("300"), "XOM": Decimal("200")}
+        matrix = {
+            "AAPL": {"MSFT": 0.9, "XOM": -0.5},
+            "CVX": {"XOM": 0.95},
+            "GLD": {},
+        }
+        candidates = {"AAPL": Decimal("10"), "CVX": Decimal("5"), "GLD": Decimal("20")}
+
+        batch = sizer.calculate_portfolio_position_size_batch(
+            candidates, existing, correlation_matrix=matrix,
+        )
+
+        assert set(batch) == set(candidates)
+        for symbol, price in candidates.items():
+            single = sizer.calculate_portfolio_position_size(
+                symbol=symbol,
+                entry_price=price,
+                existing_positions=existing,
+                correlation_matrix=matrix,
+            )
+            assert batch[symbol].shares == single.shares
+            assert batch[symbol].risk_amount == single.risk_amount
+
+    def test_position_never_exceeds_equity(self):
+        """The one-share minimum is dropped when a share costs more than equity."""
+        sizer = PositionSizer(account_equity=Decimal("1000"))
+
+        result = sizer.calculate_position_size(
+            symbol="BRK",
+            entry_price=Decimal("1500"),
+            stop_loss_price=Decimal("1450"),
+        )
+
+        assert result.shares == 0  # 90% of equity buys no shares
+        assert result.notional_value == Decimal("0")
+        assert any("exceeds account equity" in w for w in result.warnings)
+
+    def test_detailed_warnings_can_be_disabled(self):
+        """Formatted warnings are skipped without changing the size."""
+        stats = TradeStats(win_rate=0.6, avg_win=Decimal("150"), avg_loss=Decimal("100"))
+        kwargs = dict(
+            symbol="AAPL",
+            entry_price=Decimal("10"),
+            stop_loss_price=Decimal("9.50"),
+            stats=stats,
+            method=SizingMethod.KELLY,
+            num_trades=5,
+        )
+
+        verbose = PositionSizer(account_equity=Decimal("1000")).calculate_position_size(**kwargs)
+        quiet = PositionSizer(
+            account_equity=Decimal("1000"), emit_warnings=False,
+        ).calculate_position_size(**kwargs)
+
+        assert quiet.shares == verbose.shares
+        assert any("capped" in w for w in verbose.warnings)
+        assert not any("capped" in w or "sample size" in w for w in quiet.warnings)
+
+    def test_result_to_dict_uses_preformatted_amounts(self):
+        """Result amounts are formatted once and reused by to_dict."""
+        sizer = PositionSizer(account_equity=Decimal("1000"))
+
+        result = sizer.calculate_position_size(
+            symbol="AAPL",
+            entry_price=Decimal("10"),
+            stop_loss_price=Decimal("9.50"),
+        )
+        data = result.to_dict()
+
+        assert not hasattr(result, "__dict__")
+        assert data["notional_value"] == str(result.notional_value)
+        assert data["risk_amount"] == str(result.risk_amount)
+
     def test_negative_expectancy_returns_zero(self):
         """Test that negative expectancy returns zero Kelly."""
         sizer = PositionSizer(account_equity=Decimal("1000"))
@@ -117,7 +304,33 @@ class TestPositionSizing:
         kelly, warnings = sizer.calculate_kelly_fraction(stats)
         assert kelly == 0.0
         assert any("negative" in w.lower() for w in warnings)
-    
+
+    def test_no_edge_sizes_zero_shares(self):
+        """Zero Kelly returns an empty position except for fixed fractional."""
+        sizer = PositionSizer(account_equity=Decimal("1000"))
+        stats = TradeStats(win_rate=0.30, avg_win=Decimal("100"), avg_loss=Decimal("100"))
+
+        result = sizer.calculate_position_size(
+            symbol="AAPL",
+            entry_price=Decimal("10"),
+            stop_loss_price=Decimal("9.50"),
+            stats=stats,
+            num_trades=50,
+        )
+        assert result.shares == 0
+        assert result.notional_value == Decimal("0")
+        assert result.risk_amount == Decimal("0")
+
+        fixed = sizer.calculate_position_size(
+            symbol="AAPL",
+            entry_price=Decimal("10"),
+            stop_loss_price=Decimal("9.50"),
+            stats=stats,
+            method=SizingMethod.FIXED_FRACTIONAL,
+            num_trades=50,
+        )
+        assert fixed.shares > 0
+
     def test_calculate_kelly_from_trades(self):
         """Test calculating Kelly from trade history."""
         winning = [Decimal("100"), Decimal("150"), Decimal("80")]
@@ -128,6 +341,54 @@ class TestPositionSizing:
         assert stats.win_rate == 0.6  # 3/5
         assert stats.avg_win == Decimal("110")  # (100+150+80)/3
         assert stats.avg_loss == Decimal("60")  # (50+70)/2
+    
+    def test_calculate_kelly_from_float_trades(self):
+        """Float trade returns are accepted as well as Decimals."""
+        stats = calculate_kelly_from_trades([1.0, 2.0], [-1.0])
+        
+        assert stats.win_rate == pytest.approx(2 / 3)
+        assert stats.avg_win == 1.5
+        assert stats.avg_loss == 1.0
+    
+    def test_calculate_kelly_from_returns(self):
+        """Test calculating Kelly from signed trade returns."""
+        returns = [Decimal("100"), Decimal("-50"), Decimal("0"), Decimal("150"),
+                   Decimal("-70"), Decimal("80")]
+        
+        stats = calculate_kelly_from_returns(returns)
+        
+        assert stats.win_rate == 0.6
+        assert stats.avg_win == Decimal("110")
+        assert stats.avg_loss == Decimal("60")
+
+    def test_multi_asset_kelly(self):
+        """Multi-asset Kelly solves cov @ f = mu and caps gross leverage."""
+        # Uncorrelated assets reduce to per-asset mu / variance
+        uncorrelated = [[0.04, 0.0], [0.0, 0.01]]
+        weights = multi_asset_kelly([0.02, 0.01], uncorrelated, fraction=1.0, max_leverage=2.0)
+        assert weights == pytest.approx([0.5, 1.0])
+
+        # Gross 1.5 exceeds the default 1.0 cap: scaled down proportionally
+        weights = multi_asset_kelly([0.02, 0.01], uncorrelated, fraction=1.0)
+        assert weights == pytest.approx([1 / 3, 2 / 3])
+
+        # Correlated assets: full solve, then half Kelly
+        cov = [[0.04, 0.01], [0.01, 0.09]]
+        weights = multi_asset_kelly([0.03, 0.01], cov)
+        assert weights == pytest.approx([0.0026 / 0.0035 / 2, 0.0001 / 0.0035 / 2])
+
+        # Negative allocations clip at zero
+        assert multi_asset_kelly([-0.01], [[0.04]]) == [0.0]
+
+        with pytest.raises(ValueError):
+            multi_asset_kelly([0.01, 0.01], [[0.01, 0.02], [0.02, 0.01]])
+
+    def test_optimal_f_from_trades(self):
+        """Test optimal f from worst loss and average return."""
+        assert optimal_f_from_trades([]) == 0.0
+        assert optimal_f_from_trades([0.02, 0.01]) == 0.05  # No losses
+        assert optimal_f_from_trades([-0.04, 0.01, 0.01]) == 0.0  # No edge
+        assert optimal_f_from_trades([0.10, -0.20, 0.16]) == pytest.approx(0.1)
 
 
 class TestDrawdownProtection:
@@ -396,6 +657,85 @@ class TestPnLTracker:
         
         assert any(a.alert_type == AlertType.DAILY_LOSS_LIMIT for a in alerts_received)
     
+    @pytest.mark.asyncio
+    async def test_alerts_delivered_as_batch(self):
+        """Alerts from one update arrive in a single batch callback."""
+        batches = []
+        
+        async def on_alert_batch(alerts):
+            batches.append(alerts)
+        
+        tracker = PnLTracker(
+            initial_equity=Decimal("1000"),
+            on_alert_batch=on_alert_batch,
+        )
+        
+        await tracker.update(Decimal("900"), {})
+        
+        assert len(batches) == 1
+        assert {a.alert_type for a in batches[0]} >= {
+            AlertType.DAILY_LOSS_LIMIT,
+            AlertType.DRAWDOWN_WARNING,
+        }
+        assert batches[0] == tracker.get_alerts()
+    
+    @pytest.mark.asyncio
+    async def test_alert_callbacks_run_concurrently(self):
+        """Per-alert callbacks for one update overlap rather than serialize."""
+        started = []
+        release = asyncio.Event()
+        
+        async def on_alert(alert: PnLAlert):
+            started.append(alert)
+            await release.wait()
+        
+        tracker = PnLTracker(initial_equity=Decimal("1000"), on_alert=on_alert)
+        update = asyncio.create_task(tracker.update(Decimal("900"), {}))
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        
+        assert len(started) >= 2
+        release.set()
+        await update
+    
+    @pytest.mark.asyncio
+    async def test_alert_acknowledgement(self):
+        """Acknowledging and clearing alerts keeps the pending count in step."""
+        tracker = PnLTracker(initial_equity=Decimal("1000"))
+        
+        await tracker.update(Decimal("900"), {})
+        total = len(tracker.get_alerts())
+        assert total >= 2
+        assert tracker.get_unacknowledged_count() == total
+        
+        tracker.acknowledge_alert(0)
+        tracker.acknowledge_alert(0)
+        assert tracker.get_unacknowledged_count() == total - 1
+        assert len(tracker.get_alerts()) == total - 1
+        
+        tracker.clear_acknowledged_alerts()
+        assert len(tracker.get_alerts(unacknowledged_only=False)) == total - 1
+        
+        tracker.acknowledge_all_alerts()
+        assert tracker.get_unacknowledged_count() == 0
+        assert tracker.get_alerts() == []
+    
+    @pytest.mark.asyncio
+    async def test_alert_acknowledged_through_returned_object(self):
+        """Setting acknowledged on a returned alert updates the pending count."""
+        tracker = PnLTracker(initial_equity=Decimal("1000"))
+        
+        await tracker.update(Decimal("900"), {})
+        alerts = tracker.get_alerts()
+        total = len(alerts)
+        
+        alerts[0].acknowledged = True
+        assert tracker.get_unacknowledged_count() == total - 1
+        
+        tracker.acknowledge_all_alerts()
+        alerts[0].acknowledged = False
+        assert tracker.get_unacknowledged_count() == 1
+    
     @pytest.mark.asyncio
     async def test_position_profit_alert(self):
         """Test position-level profit alert."""
@@ -477,6 +817,194 @@ class TestPnLTracker:
         assert pnl.winning_trades == 2
         assert pnl.losing_trades == 1
         assert pnl.win_rate == pytest.approx(0.667, rel=0.01)
+    
+    @pytest.mark.asyncio
+    async def test_velocity_alert_after_history_wraps(self):
+        """Velocity uses the window's oldest sample once the ring buffer wraps."""
+        alerts_received = []
+        
+        async def on_alert(alert: PnLAlert):
+            alerts_received.append(alert)
+        
+        config = AlertConfig(
+            velocity_threshold_pct=0.02,
+            velocity_window_minutes=1,
+            drawdown_warning_pct=0.5,
+        )
+        tracker = PnLTracker(
+            config=config,
+            initial_equity=Decimal("1000"),
+            on_alert=on_alert,
+        )
+        
+        for i in range(tracker._hist_cap + 50):
+            await tracker.update(Decimal("1000") + Decimal(i % 2) / 100, {})
+        assert not any(a.alert_type == AlertType.PNL_VELOCITY for a in alerts_received)
+        
+        await tracker.update(Decimal("970"), {})
+        
+        velocity = [a for a in alerts_received if a.alert_type == AlertType.PNL_VELOCITY]
+        assert len(velocity) == 1
+        assert velocity[0].value == Decimal("-30.01")
+    
+    @pytest.mark.asyncio
+    async def test_unchanged_update_is_skipped(self):
+        """Repeated inputs skip evaluation, but realized P&L is never dropped."""
+        tracker = PnLTracker(initial_equity=Decimal("1000"))
+        
+        await tracker.update(Decimal("1010"), {})
+        await tracker.update(Decimal("1010"), {})
+        assert tracker._hist_count == 1
+        
+        await tracker.update(Decimal("1015"), {}, realized_pnl=Decimal("5"))
+        await tracker.update(Decimal("1015"), {}, realized_pnl=Decimal("5"))
+        assert tracker._hist_count == 3
+        assert tracker.get_portfolio_pnl().total_realized_pnl == Decimal("10")
+    
+    @pytest.mark.asyncio
+    async def test_daily_reset_at_midnight(self):
+        """Daily realized P&L resets on the first update after midnight."""
+        tracker = PnLTracker(initial_equity=Decimal("1000"))
+        tracker.record_trade(Decimal("20"))
+        
+        tracker._next_daily_reset = datetime.now() - timedelta(seconds=1)
+        await tracker.update(Decimal("1020"), {})
+        
+        pnl = tracker.get_portfolio_pnl()
+        assert pnl.daily_realized_pnl == Decimal("0")
+        assert pnl.total_realized_pnl == Decimal("20")
+        assert tracker._next_daily_reset > datetime.now()
+    
+    @pytest.mark.asyncio
+    async def test_total_unrealized_follows_positions(self):
+        """Running unrealized total tracks updates and closed positions."""
+        tracker = PnLTracker(initial_equity=Decimal("1000"))
+        
+        await tracker.update(Decimal("1030"), {
+            "AAPL": {"qty": 5, "unrealized_pnl": Decimal("25")},
+            "MSFT": {"qty": 2, "unrealized_pnl": Decimal("5")},
+        })
+        assert tracker.get_portfolio_pnl().total_unrealized_pnl == Decimal("30")
+        
+        await tracker.update(Decimal("1010"), {
+            "AAPL": {"qty": 5, "unrealized_pnl": Decimal("10")},
+        })
+        assert tracker.get_portfolio_pnl().total_unrealized_pnl == Decimal("10")
+        
+        all_pnl = tracker.get_all_position_pnl()
+        assert list(all_pnl) == ["AAPL"]
+        with pytest.raises(TypeError):
+            all_pnl["MSFT"] = all_pnl["AAPL"]
+    
+    @pytest.mark.asyncio
+    async def test_expired_cooldowns_are_pruned(self):
+        """Lapsed alert cooldowns are dropped instead of accumulating."""
+        config = AlertConfig(cooldown_minutes=0)
+        tracker = PnLTracker(config=config, initial_equity=Decimal("1000"))
+        
+        await tracker.update(Decimal("1000"), {
+            "AAPL": {"qty": 5, "unrealized_pnl": Decimal("-50")},
+        })
+        assert "position_loss:AAPL" in tracker._alert_cooldowns
+        
+        await tracker.update(Decimal("1000"), {})
+        assert tracker._alert_cooldowns == {}
+        assert tracker._cooldown_heap == []
+    
+    @pytest.mark.asyncio
+    async def test_position_pnl_fixed_point(self):
+        """Position P&L is stored in fixed-point units and exported as dollars."""
+        tracker = PnLTracker(initial_equity=Decimal("1000"))
+        
+        positions = {
+            "AAPL": {
+                "qty": 4,
+                "side": "short",
+                "entry_price": Decimal("50.25"),
+                "current_price": 49.75,
+                "unrealized_pnl": "2.00",
+            }
+        }
+        
+        await tracker.update(Decimal("1002.00"), positions)
+        
+        pos = tracker.get_position_pnl("AAPL")
+        assert pos.unrealized_pnl_pct == pytest.approx(0.5 / 50.25)
+        assert pos.unrealized_pnl_u == 2_000_000
+        assert pos.unrealized_pnl == Decimal("2.00")
+        assert pos.entry_price == Decimal("50.25")
+        assert pos.to_dict()["unrealized_pnl"] == "2"
+        assert pos.to_dict()["entry_price"] == "50.25"
+        
+        pnl = tracker.get_portfolio_pnl()
+        assert pnl.total_unrealized_pnl == Decimal("2.00")
+        assert pnl.current_equity == Decimal("1002")
+        
+        positions["AAPL"]["current_price"] = 51.25
+        await tracker.update(Decimal("998.00"), positions)
+        assert pos.is_long is False
+        assert pos.unrealized_pnl_pct == pytest.approx(-1 / 50.25)
+
+    @pytest.mark.asyncio
+    async def test_position_reversal_updates_side(self):
+        """Reversing a position re-derives the side on the next update."""
+        tracker = PnLTracker(initial_equity=Decimal("10000"))
+
+        positions = {
+            "AAPL": {
+                "qty": 10,
+                "side": "long",
+                "entry_price": Decimal("100"),
+                "current_price": Decimal("101"),
+                "unrealized_pnl": Decimal("10"),
+            }
+        }
+        await tracker.update(Decimal("10010"), positions)
+        assert tracker.get_position_pnl("AAPL").is_long is True
+
+        positions["AAPL"].update(
+            side="short",
+            current_price=Decimal("112"),
+            unrealized_pnl=Decimal("-120"),
+        )
+        await tracker.update(Decimal("9880"), positions)
+
+        pos = tracker.get_position_pnl("AAPL")
+        assert pos.side == "short"
+        assert pos.is_long is False
+        assert pos.unrealized_pnl_pct == pytest.approx(-0.12)
+        assert pos.unrealized_pnl == Decimal("-120")
+        assert not any("up" in alert.message for alert in tracker.get_alerts())
+
+    def test_pnl_velocity_uses_velocity_window(self):
+        """Reported velocity covers the alert window, not the whole buffer."""
+        tracker = PnLTracker(initial_equity=Decimal("1000"))
+        start = 1_700_000_000.0
+        flat = to_units(Decimal("1000"))
+
+        # Two hours of flat equity overflow the history buffer...
+        for i in range(3600):
+            tracker._record_history(start + 2 * i, flat)
+        assert tracker._hist_count == tracker._hist_cap
+
+        # ...then equity climbs $10/min over the last 5 minutes
+        end = start + 2 * 3599
+        for j in range(1, 151):
+            tracker._record_history(end + 2 * j, flat + j * to_units(Decimal("10")) // 30)
+
+        pnl = tracker.get_portfolio_pnl()
+        assert float(pnl.pnl_velocity) == pytest.approx(10, abs=0.01)
+
+    def test_pnl_velocity_short_history(self):
+        """With all samples inside the window, velocity spans first to last."""
+        tracker = PnLTracker(initial_equity=Decimal("1000"))
+        assert tracker.get_portfolio_pnl().pnl_velocity == Decimal("0")
+
+        start = 1_700_000_000.0
+        for offset, equity in ((0, "1000"), (60, "1010"), (120, "1030")):
+            tracker._record_history(start + offset, to_units(Decimal(equity)))
+
+        assert tracker.get_portfolio_pnl().pnl_velocity == Decimal("15")
 
 
 class TestIntegratedRiskManager:
@@ -561,6 +1089,30 @@ class TestIntegratedRiskManager:
         # May be limited by exposure
         assert decision.recommended_notional <= Decimal("500")
     
+    @pytest.mark.asyncio
+    async def test_engine_positions_follow_in_place_edits(self):
+        """Position dicts edited in place after update_state reach the risk engine."""
+        manager = create_risk_manager(account_equity=Decimal("1000"))
+        positions = {
+            "AAPL": {"qty": 1, "avg_entry_price": Decimal("100"), "market_value": Decimal("100")},
+            "MSFT": {"qty": 2, "avg_entry_price": Decimal("50"), "market_value": Decimal("100")},
+        }
+        await manager.update_state(equity=Decimal("1000"), positions=positions)
+        
+        first = manager._get_engine_positions()
+        assert first["AAPL"].market_value == Decimal("100")
+        
+        positions["AAPL"]["qty"] = 3
+        positions["AAPL"]["market_value"] = Decimal("300")
+        del positions["MSFT"]
+        second = manager._get_engine_positions()
+        
+        assert second["AAPL"].qty == 3
+        assert second["AAPL"].market_value == Decimal("300")
+        assert "MSFT" not in second
+        # Unchanged positions are not rebuilt
+        assert manager._get_engine_positions()["AAPL"] is second["AAPL"]
+    
     @pytest.mark.asyncio
     async def test_kill_switch(self):
         """Test kill switch activation."""